@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import html
+import itertools
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
-from uuid import uuid4
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import structlog
 from recruitment_assistant.logging_config import get_app_logger
 
@@ -22,27 +32,79 @@ def _current_time() -> datetime:
     return datetime.now(timezone.utc)
 
 
+_DRAFT_SEED = secrets.randbits(24)
+_draft_counter = itertools.count()
+
+
+def _next_draft_id() -> str:
+    """Return a process-unique outreach draft identifier."""
+    return f"DRAFT-{(_DRAFT_SEED ^ next(_draft_counter)) & 0xFFFFFF:06X}"
+
+
+@lru_cache(maxsize=4096)
 def _stable_candidate_id(name: str, job_title: str) -> str:
     """Generate a deterministic candidate identifier based on the JD context."""
     key = f"{name}|{job_title}"
-    digest = hashlib.md5(key.encode("utf-8")).hexdigest()[:8]
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4).hexdigest()
     return f"CAN-{digest.upper()}"
 
 
+def _intern_all(values: Any) -> Tuple[str, ...]:
+    """Intern tag-like strings so repeated labels share one object across profiles."""
+    return tuple(map(sys.intern, values))
+
+
+_BOOST_TAGS: frozenset[str] = frozenset(_intern_all(("Manual Review Required", "Data Deficient")))
+_BIAS_TAGS: Tuple[str, ...] = _intern_all(("Data Deficient", "Manual Review Required"))
+_BIAS_WARNING = sys.intern("Bias Warning")
+_RESULT_CACHE_SIZE = 32
+_TRACE_ENABLED = os.getenv("AGENT_TRACE_ENABLED", "false").lower() in {"1", "true", "yes"}
+_PARALLEL_MIN_SEEDS = 4
+_OUTREACH_TEMPLATE = (
+    "Hi {name},\n\n"
+    "I saw your work as a {role} and the way you {rationale}\n"
+    "{compliance} {eu_statement}\n"
+    "{cta}.\n\n"
+    "Best,\nRecruitment Assistant Crew"
+)
+
+
+def _evaluation_kernel(
+    seed_scores: np.ndarray, thresholds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return clamped evaluation scores and the below-threshold bias mask."""
+    return np.minimum(1.0, seed_scores + 0.1), seed_scores < thresholds
+
+
+def _ranking_kernel(
+    scores: np.ndarray, diversity_mask: np.ndarray, diversity_bonus: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the descending rank order and the boosted final scores in that order."""
+    # Stable descending order keeps ties in input order, like sorted(reverse=True).
+    order = np.argsort(-scores, kind="stable")
+    final_scores = np.minimum(1.0, scores + np.where(diversity_mask, diversity_bonus, 0.0))
+    return order, final_scores[order]
+
+
 class CrewError(Exception):
     """Domain errors surfaced by the RecruitmentCrew stack."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobDescriptionModel:
     """Represents the recruitment brief used to guide the agents."""
     title: str
     content: str
     created_at: datetime = field(default_factory=_current_time)
     classification: str = "Tier-2"
+    content_bonus: float = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Researcher score uplift for richer briefs; fixed for the lifetime of the JD.
+        object.__setattr__(self, "content_bonus", len(self.content) / 400)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CandidateSeed:
     """Candidate attributes discovered during the research phase."""
     candidate_id: str
@@ -50,12 +112,13 @@ class CandidateSeed:
     role: str
     score: float
     rationale: str
-    tags: List[str]
-    data_sources: List[str]
+    tags: Tuple[str, ...]
+    data_sources: Tuple[str, ...]
+    profile_url: str
     sourced_at: datetime = field(default_factory=_current_time)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvaluationResult:
     """Structured output from the evaluator agent per candidate."""
     candidate_id: str
@@ -63,14 +126,18 @@ class EvaluationResult:
     role: str
     score: float
     rationale: str
-    bias_flags: List[str]
+    bias_flags: Tuple[str, ...]
     comments: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     profile_url: str
     evaluated_at: datetime = field(default_factory=_current_time)
+    bias_flag_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "bias_flag_count", len(self.bias_flags))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RankedCandidate:
     """Final ranking details shared with the outreach workflow."""
     candidate_id: str
@@ -78,8 +145,8 @@ class RankedCandidate:
     role: str
     final_score: float
     rationale: str
-    tags: List[str]
-    bias_flags: List[str]
+    tags: Tuple[str, ...]
+    bias_flags: Tuple[str, ...]
     rank_label: str
     recommendation: str
     profile_url: str
@@ -87,7 +154,7 @@ class RankedCandidate:
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutreachTemplate:
     """Reusable outreach script metadata and compliance hints."""
     tone: str = "professional"
@@ -98,18 +165,18 @@ class OutreachTemplate:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutreachDraft:
     """Candidate-specific outreach message generated from a template."""
     campaign_id: str
     candidate_id: str
     message: str
     template: OutreachTemplate
-    draft_id: str = field(default_factory=lambda: f"DRAFT-{uuid4().hex[:6].upper()}")
+    draft_id: str = field(default_factory=_next_draft_id)
     created_at: datetime = field(default_factory=_current_time)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RankingPolicy:
     """Configurable ranking knobs used by the recommender."""
     name: str = "balanced"
@@ -118,7 +185,7 @@ class RankingPolicy:
     respect_bias_flags: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompliancePolicy:
     """Static compliance metadata for GDPR and EU AI Act claims."""
     gdpr_note: str = "Personal data processed only for recruitment; subject rights respected."
@@ -127,7 +194,7 @@ class CompliancePolicy:
     logging_level: str = "INFO"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskAssessment:
     """Quantified risk artifacts emitted by the crew."""
     score: float
@@ -136,58 +203,103 @@ class RiskAssessment:
     evaluated_at: datetime = field(default_factory=_current_time)
 
 
-BASE_PROFILES: List[Dict[str, Any]] = [
-    {
-        "name": "Alex Dev",
-        "role": "Backend Engineer",
-        "score": 0.60,
-        "tags": ["Data Deficient", "Manual Review Required"],
-        "data_sources": ["Serper.dev", "GitHub"],
-        "profile_url": "https://talent.example.com/alex-dev",
-    },
-    {
-        "name": "Marina Byte",
-        "role": "Full Stack Engineer",
-        "score": 0.72,
-        "tags": ["High Confidence"],
-        "data_sources": ["Serper.dev", "Portfolio"],
-        "profile_url": "https://talent.example.com/marina-byte",
-    },
-    {
-        "name": "Kai Ops",
-        "role": "DevOps Engineer",
-        "score": 0.68,
-        "tags": ["Manual Review Required"],
-        "data_sources": ["GitHub", "Browserless.io"],
-        "profile_url": "https://talent.example.com/kai-ops",
-    },
-    {
-        "name": "Nia Vector",
-        "role": "Platform Architect",
-        "score": 0.64,
-        "tags": ["Leadership Potential"],
-        "data_sources": ["LinkedIn", "Public Portfolio"],
-        "profile_url": "https://talent.example.com/nia-vector",
-    },
-]
+@dataclass(frozen=True, slots=True)
+class ProfileRecord:
+    """Immutable candidate profile entry consumed by the researcher."""
+    name: str
+    role: str
+    score: float
+    tags: Tuple[str, ...]
+    data_sources: Tuple[str, ...]
+    profile_url: str
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tags", _intern_all(self.tags))
+        object.__setattr__(self, "data_sources", _intern_all(self.data_sources))
+
+    @classmethod
+    def from_mapping(cls, profile: Mapping[str, Any]) -> "ProfileRecord":
+        """Build a profile record from a loosely typed candidate pool entry."""
+        return cls(
+            name=profile["name"],
+            role=profile["role"],
+            score=float(profile["score"]),
+            tags=profile.get("tags", ()),
+            data_sources=profile.get("data_sources", ()),
+            profile_url=profile.get("profile_url")
+            or f"https://talent.example.com/{profile['name'].lower().replace(' ', '-')}",
+        )
+
+
+BASE_PROFILES: Tuple[ProfileRecord, ...] = (
+    ProfileRecord(
+        name="Alex Dev",
+        role="Backend Engineer",
+        score=0.60,
+        tags=("Data Deficient", "Manual Review Required"),
+        data_sources=("Serper.dev", "GitHub"),
+        profile_url="https://talent.example.com/alex-dev",
+    ),
+    ProfileRecord(
+        name="Marina Byte",
+        role="Full Stack Engineer",
+        score=0.72,
+        tags=("High Confidence",),
+        data_sources=("Serper.dev", "Portfolio"),
+        profile_url="https://talent.example.com/marina-byte",
+    ),
+    ProfileRecord(
+        name="Kai Ops",
+        role="DevOps Engineer",
+        score=0.68,
+        tags=("Manual Review Required",),
+        data_sources=("GitHub", "Browserless.io"),
+        profile_url="https://talent.example.com/kai-ops",
+    ),
+    ProfileRecord(
+        name="Nia Vector",
+        role="Platform Architect",
+        score=0.64,
+        tags=("Leadership Potential",),
+        data_sources=("LinkedIn", "Public Portfolio"),
+        profile_url="https://talent.example.com/nia-vector",
+    ),
+)
 
 
 class AgentTracer:
     """Context manager that logs agent work boundaries."""
 
-    def __init__(self, logger: structlog.BoundLogger, agent_name: str) -> None:
+    def __init__(
+        self, logger: structlog.BoundLogger, agent_name: str, enabled: bool = _TRACE_ENABLED
+    ) -> None:
         self.logger = logger
         self.agent_name = agent_name
+        self.enabled = enabled
 
     @contextmanager
     def trace(self, operation: str, **context: Any) -> Iterator[None]:
         """Context manager that logs the start, error, and end of an agent operation."""
-        start = datetime.now(timezone.utc)
+        if not self.enabled:
+            # Start/end events are opt-in; failures are always logged.
+            try:
+                yield
+            except Exception as exc:
+                self.logger.exception(
+                    "agent_operation_failed",
+                    agent=self.agent_name,
+                    operation=operation,
+                    error=str(exc),
+                    **context,
+                )
+                raise CrewError(f"{self.agent_name} failed during {operation}") from exc
+            return
+        # Wall-clock timestamps come from the Loguru record the event lands in.
+        start_ns = time.perf_counter_ns()
         self.logger.info(
             "agent_operation_start",
             agent=self.agent_name,
             operation=operation,
-            timestamp=start.isoformat(),
             **context,
         )
         try:
@@ -202,7 +314,7 @@ class AgentTracer:
             )
             raise CrewError(f"{self.agent_name} failed during {operation}") from exc
         finally:
-            duration = (datetime.now(timezone.utc) - start).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             self.logger.info(
                 "agent_operation_end",
                 agent=self.agent_name,
@@ -215,8 +327,9 @@ class AgentTracer:
 class BaseAgent:
     """Base class that injects tracing for every agent."""
 
-    def __init__(self, name: str) -> None:
-        self.tracer = AgentTracer(logger.bind(agent=name), name)
+    def __init__(self, name: str, trace_enabled: Optional[bool] = None) -> None:
+        self._trace_enabled = _TRACE_ENABLED if trace_enabled is None else trace_enabled
+        self.tracer = AgentTracer(logger.bind(agent=name), name, self._trace_enabled)
 
 
 class ResearcherAgent(BaseAgent):
@@ -224,39 +337,62 @@ class ResearcherAgent(BaseAgent):
     def __init__(
         self,
         llm_model: str = "gpt-4o-mini",
-        candidate_pool: Optional[Sequence[Dict[str, Any]]] = None,
+        candidate_pool: Optional[Sequence[Union[ProfileRecord, Mapping[str, Any]]]] = None,
     ) -> None:
         super().__init__("researcher")
         self.role = "Technical Talent Sourcer"
         self.goal = "Find a diverse slate that fits the JD"
         self.llm_model = llm_model
-        self._candidate_pool = list(candidate_pool or BASE_PROFILES)
+        self._candidate_pool: Tuple[ProfileRecord, ...] = tuple(
+            profile if isinstance(profile, ProfileRecord) else ProfileRecord.from_mapping(profile)
+            for profile in (candidate_pool or BASE_PROFILES)
+        )
+
+    def _build_seed(
+        self, profile: ProfileRecord, job_description: JobDescriptionModel, content_bonus: float
+    ) -> CandidateSeed:
+        """Turn a single pool profile into a candidate seed for the JD."""
+        rationale = (
+            f"{profile.name} shows a {profile.role} signal that aligns with {job_description.title}."
+        )
+        return CandidateSeed(
+            candidate_id=_stable_candidate_id(profile.name, job_description.title),
+            name=profile.name,
+            role=profile.role,
+            score=min(0.95, profile.score + content_bonus),
+            rationale=rationale,
+            tags=profile.tags,
+            data_sources=profile.data_sources,
+            profile_url=profile.profile_url,
+        )
 
     def research(self, job_description: JobDescriptionModel, limit: int = 4) -> List[CandidateSeed]:
         """Discover candidate seeds that match the job description."""
         with self.tracer.trace(
             "research", job_title=job_description.title, limit=limit, model=self.llm_model
         ):
-            seeds: List[CandidateSeed] = []
-            content_bonus = len(job_description.content) / 400
-            for profile in self._candidate_pool[:limit]:
-                candidate_id = _stable_candidate_id(profile["name"], job_description.title)
-                score = min(0.95, profile["score"] + content_bonus)
-                rationale = (
-                    f"{profile['name']} shows a {profile['role']} signal that aligns with {job_description.title}."
-                )
-                seeds.append(
-                    CandidateSeed(
-                        candidate_id=candidate_id,
-                        name=profile["name"],
-                        role=profile["role"],
-                        score=score,
-                        rationale=rationale,
-                        tags=list(profile["tags"]),
-                        data_sources=list(profile["data_sources"]),
-                    )
-                )
-            return seeds
+            content_bonus = job_description.content_bonus
+            return [
+                self._build_seed(profile, job_description, content_bonus)
+                for profile in self._candidate_pool[:limit]
+            ]
+
+    async def research_async(
+        self,
+        job_description: JobDescriptionModel,
+        seeds: "asyncio.Queue[Optional[CandidateSeed]]",
+        limit: int = 4,
+    ) -> None:
+        """Stream candidate seeds into the queue, closing it with a ``None`` sentinel."""
+        try:
+            with self.tracer.trace(
+                "research_async", job_title=job_description.title, limit=limit, model=self.llm_model
+            ):
+                content_bonus = job_description.content_bonus
+                for profile in self._candidate_pool[:limit]:
+                    await seeds.put(self._build_seed(profile, job_description, content_bonus))
+        finally:
+            await seeds.put(None)
 
 
 class EvaluatorAgent(BaseAgent):
@@ -265,51 +401,90 @@ class EvaluatorAgent(BaseAgent):
         self,
         llm_model: str = "gpt-4o",
         bias_thresholds: Optional[Mapping[str, float]] = None,
+        parallel: bool = False,
+        max_workers: int = 8,
     ) -> None:
         super().__init__("evaluator")
         self.role = "Senior Technical Interviewer"
         self.goal = "Screen candidates objectively for bias"
         self.llm_model = llm_model
+        self.parallel = parallel
+        self.max_workers = max_workers
         self._bias_thresholds = dict(bias_thresholds or {"default": 0.65})
+        self._default_threshold = self._bias_thresholds["default"]
+        self._threshold_get = self._bias_thresholds.get
+
+    def _build_evaluation(
+        self, seed: CandidateSeed, score: float, below_threshold: bool
+    ) -> EvaluationResult:
+        """Assemble the evaluation artifact and its bias flags from precomputed scores."""
+        bias_flags = tuple(tag for tag in _BIAS_TAGS if tag in seed.tags)
+        if below_threshold:
+            bias_flags += (_BIAS_WARNING,)
+        return EvaluationResult(
+            candidate_id=seed.candidate_id,
+            candidate_name=seed.name,
+            role=seed.role,
+            score=score,
+            rationale=seed.rationale,
+            bias_flags=bias_flags,
+            comments=f"Evaluated {seed.name}; {len(seed.tags)} tag(s) observed.",
+            tags=seed.tags,
+            profile_url=seed.profile_url,
+        )
 
-    def _derive_bias_flags(self, seed: CandidateSeed) -> List[str]:
-        """Create bias flags based on the candidate seed metadata."""
-        flags: List[str] = []
-        if "Data Deficient" in seed.tags:
-            flags.append("Data Deficient")
-        if "Manual Review Required" in seed.tags:
-            flags.append("Manual Review Required")
-        threshold = self._bias_thresholds.get(seed.role, self._bias_thresholds["default"])
-        if seed.score < threshold:
-            flags.append("Bias Warning")
-        return flags
+    def _evaluate_one(self, seed: CandidateSeed) -> EvaluationResult:
+        """Score a single candidate seed."""
+        threshold = self._threshold_get(seed.role, self._default_threshold)
+        return self._build_evaluation(seed, min(1.0, seed.score + 0.1), seed.score < threshold)
 
     def evaluate(self, seeds: Sequence[CandidateSeed]) -> List[EvaluationResult]:
         """Score the provided candidate seeds and emit evaluation artifacts."""
+        if self.parallel:
+            return self.evaluate_parallel(seeds, max_workers=self.max_workers)
         with self.tracer.trace(
             "evaluate", candidate_count=len(seeds), model=self.llm_model
         ):
-            results: List[EvaluationResult] = []
-            for seed in seeds:
-                bias_flags = self._derive_bias_flags(seed)
-                score = min(1.0, seed.score + 0.1)
-                comments = (
-                    f"Evaluated {seed.name}; {len(seed.tags)} tag(s) observed."
-                )
-                results.append(
-                    EvaluationResult(
-                        candidate_id=seed.candidate_id,
-                        candidate_name=seed.name,
-                        role=seed.role,
-                        score=score,
-                        rationale=seed.rationale,
-                        bias_flags=bias_flags,
-                        comments=comments,
-                        tags=list(seed.tags),
-                        profile_url=f"https://talent.example.com/{seed.name.lower().replace(' ', '-')}",
-                    )
-                )
-            return results
+            count = len(seeds)
+            seed_scores = np.fromiter((seed.score for seed in seeds), dtype=np.float64, count=count)
+            threshold_get, default_threshold = self._threshold_get, self._default_threshold
+            thresholds = np.fromiter(
+                (threshold_get(seed.role, default_threshold) for seed in seeds),
+                dtype=np.float64,
+                count=count,
+            )
+            scores, below_threshold = _evaluation_kernel(seed_scores, thresholds)
+            return [
+                self._build_evaluation(seed, score, warned)
+                for seed, score, warned in zip(seeds, scores.tolist(), below_threshold.tolist())
+            ]
+
+    def evaluate_parallel(
+        self, seeds: Sequence[CandidateSeed], max_workers: int = 8
+    ) -> List[EvaluationResult]:
+        """Evaluate seeds on a thread pool for latency-bound (LLM-backed) scoring.
+
+        Small batches stay serial because pool start-up outweighs the overlap.
+        """
+        with self.tracer.trace(
+            "evaluate_parallel", candidate_count=len(seeds), model=self.llm_model
+        ):
+            if len(seeds) < _PARALLEL_MIN_SEEDS:
+                return [self._evaluate_one(seed) for seed in seeds]
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="evaluator"
+            ) as executor:
+                return list(executor.map(self._evaluate_one, seeds))
+
+    async def evaluate_async(
+        self, seeds: "asyncio.Queue[Optional[CandidateSeed]]"
+    ) -> List[EvaluationResult]:
+        """Evaluate seeds as they arrive on the queue, preserving arrival order."""
+        with self.tracer.trace("evaluate_async", model=self.llm_model):
+            pending: List[asyncio.Task[EvaluationResult]] = []
+            while (seed := await seeds.get()) is not None:
+                pending.append(asyncio.create_task(asyncio.to_thread(self._evaluate_one, seed)))
+            return list(await asyncio.gather(*pending))
 
 
 class RecommenderAgent(BaseAgent):
@@ -326,15 +501,21 @@ class RecommenderAgent(BaseAgent):
         """Produce ranked candidates using the supplied policy."""
         self._apply_policy(policy)
         with self.tracer.trace("recommend", policy=policy.name):
-            sorted_evaluations = sorted(evaluations, key=lambda entry: entry.score, reverse=True)
+            count = len(evaluations)
+            scores = np.fromiter(
+                (evaluation.score for evaluation in evaluations), dtype=np.float64, count=count
+            )
+            diversity_mask = np.fromiter(
+                (not _BOOST_TAGS.isdisjoint(evaluation.tags) for evaluation in evaluations),
+                dtype=bool,
+                count=count,
+            )
+            order, final_scores = _ranking_kernel(scores, diversity_mask, policy.diversity_bonus)
             ranked_candidates: List[RankedCandidate] = []
-            for position, evaluation in enumerate(sorted_evaluations, start=1):
-                diversity_boost = (
-                    policy.diversity_bonus
-                    if any(tag in ["Manual Review Required", "Data Deficient"] for tag in evaluation.tags)
-                    else 0.0
-                )
-                final_score = min(1.0, evaluation.score + diversity_boost)
+            for position, (index, final_score) in enumerate(
+                zip(order.tolist(), final_scores.tolist()), start=1
+            ):
+                evaluation = evaluations[index]
                 rank_label = f"Tier {1 + (position - 1) // 2}"
                 recommendation = (
                     f"Rank {position}: {evaluation.candidate_name} ({final_score:.2f})"
@@ -347,8 +528,8 @@ class RecommenderAgent(BaseAgent):
                         role=evaluation.role,
                         final_score=final_score,
                         rationale=evaluation.rationale,
-                        tags=list(evaluation.tags),
-                        bias_flags=list(evaluation.bias_flags),
+                        tags=evaluation.tags,
+                        bias_flags=evaluation.bias_flags,
                         rank_label=rank_label,
                         recommendation=recommendation,
                         profile_url=evaluation.profile_url,
@@ -365,6 +546,16 @@ class RecommenderAgent(BaseAgent):
         """Expose policy switching to external callers."""
         self._apply_policy(policy)
 
+@lru_cache(maxsize=64)
+def _escape_template(template: OutreachTemplate) -> Tuple[str, str, str]:
+    """Escape the template-level outreach fragments once per template."""
+    return (
+        html.escape(template.cta),
+        html.escape(template.compliance_notes),
+        html.escape(template.eu_ai_statement),
+    )
+
+
 class WriterAgent(BaseAgent):
     """Drafts compliant outreach touchpoints for ranked candidates."""
     def __init__(self) -> None:
@@ -380,30 +571,108 @@ class WriterAgent(BaseAgent):
         self, campaign_id: str, candidate: RankedCandidate, template: OutreachTemplate
     ) -> OutreachDraft:
         """Generate an outreach draft for a single ranked candidate."""
+        return self.draft_with_pre_escaped(
+            campaign_id, candidate, template, _escape_template(template)
+        )
+
+    def draft_with_pre_escaped(
+        self,
+        campaign_id: str,
+        candidate: RankedCandidate,
+        template: OutreachTemplate,
+        escaped_template: Tuple[str, str, str],
+    ) -> OutreachDraft:
+        """Generate an outreach draft reusing the already-escaped template fragments."""
         with self.tracer.trace(
             "draft", campaign_id=campaign_id, candidate_id=candidate.candidate_id
         ):
-            safe_name = self._sanitize(candidate.name)
-            safe_role = self._sanitize(candidate.role)
-            safe_rationale = self._sanitize(candidate.rationale.lower())
-            safe_cta = self._sanitize(template.cta)
-            safe_compliance = self._sanitize(template.compliance_notes)
-            safe_eu_statement = self._sanitize(template.eu_ai_statement)
-            message = (
-                f"Hi {safe_name},\n\n"
-                f"I saw your work as a {safe_role} and the way you {safe_rationale}\n"
-                f"{safe_compliance} {safe_eu_statement}\n"
-                f"{safe_cta}.\n\n"
-                "Best,\nRecruitment Assistant Crew"
-            )
-            return OutreachDraft(
-                campaign_id=campaign_id,
-                candidate_id=candidate.candidate_id,
-                message=message,
-                template=template,
+            return self._draft_unwrapped(campaign_id, candidate, template, escaped_template)
+
+    def draft_batch(
+        self,
+        campaign_id: str,
+        candidates: Sequence[RankedCandidate],
+        template: OutreachTemplate,
+    ) -> List[OutreachDraft]:
+        """Generate drafts for a roster under a single batch-level trace."""
+        escaped_template = _escape_template(template)
+        with self.tracer.trace(
+            "draft_batch", campaign_id=campaign_id, candidate_count=len(candidates)
+        ):
+            return [
+                self._draft_unwrapped(campaign_id, candidate, template, escaped_template)
+                for candidate in candidates
+            ]
+
+    def _draft_unwrapped(
+        self,
+        campaign_id: str,
+        candidate: RankedCandidate,
+        template: OutreachTemplate,
+        escaped_template: Tuple[str, str, str],
+    ) -> OutreachDraft:
+        """Render a single draft without tracing; callers own the trace span."""
+        safe_cta, safe_compliance, safe_eu_statement = escaped_template
+        message = _OUTREACH_TEMPLATE.format_map(
+            {
+                "name": self._sanitize(candidate.name),
+                "role": self._sanitize(candidate.role),
+                "rationale": self._sanitize(candidate.rationale.lower()),
+                "compliance": safe_compliance,
+                "eu_statement": safe_eu_statement,
+                "cta": safe_cta,
+            }
+        )
+        return OutreachDraft(
+            campaign_id=campaign_id,
+            candidate_id=candidate.candidate_id,
+            message=message,
+            template=template,
+        )
+
+    async def draft_async(
+        self,
+        campaign_id: str,
+        candidate: RankedCandidate,
+        template: OutreachTemplate,
+        escaped_template: Optional[Tuple[str, str, str]] = None,
+    ) -> OutreachDraft:
+        """Generate an outreach draft on a worker thread."""
+        return await asyncio.to_thread(
+            self.draft_with_pre_escaped,
+            campaign_id,
+            candidate,
+            template,
+            escaped_template or _escape_template(template),
+        )
+
+    async def draft_batch_async(
+        self,
+        campaign_id: str,
+        candidates: Sequence[RankedCandidate],
+        template: OutreachTemplate,
+    ) -> List[OutreachDraft]:
+        """Draft a roster concurrently on worker threads under one batch-level trace."""
+        escaped_template = _escape_template(template)
+        with self.tracer.trace(
+            "draft_batch_async", campaign_id=campaign_id, candidate_count=len(candidates)
+        ):
+            return list(
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(
+                            self._draft_unwrapped, campaign_id, candidate, template, escaped_template
+                        )
+                        for candidate in candidates
+                    )
+                )
             )
 
 
+_CampaignResult = Tuple[List[RankedCandidate], List[EvaluationResult], RiskAssessment]
+_RerankResult = Tuple[Sequence[EvaluationResult], List[RankedCandidate], RiskAssessment]
+
+
 class RecruitmentCrew:
     """Facade that orchestrates sourcing, evaluation, ranking, and outreach."""
 
@@ -412,7 +681,7 @@ class RecruitmentCrew:
         jd_data: Optional[Dict[str, Any]] = None,
         policy: Optional[RankingPolicy] = None,
         compliance_policy: Optional[CompliancePolicy] = None,
-        candidate_pool: Optional[Sequence[Dict[str, Any]]] = None,
+        candidate_pool: Optional[Sequence[Union[ProfileRecord, Mapping[str, Any]]]] = None,
         evaluator_bias_thresholds: Optional[Mapping[str, float]] = None,
     ) -> None:
         self.policy = policy or RankingPolicy()
@@ -427,6 +696,10 @@ class RecruitmentCrew:
         self.latest_candidates: List[RankedCandidate] = []
         self.latest_evaluations: List[EvaluationResult] = []
         self.risk_history: List[RiskAssessment] = []
+        self._campaign_cache: OrderedDict[bytes, _CampaignResult] = OrderedDict()
+        self._rerank_cache: OrderedDict[Tuple[int, RankingPolicy], _RerankResult] = OrderedDict()
+        # The API shares one crew across its worker threads, so LRU bookkeeping is locked.
+        self._cache_lock = threading.Lock()
         self.job_description = self._normalize_job_description(jd_data)
         if isinstance(jd_data, dict):
             self.jd_data = jd_data
@@ -461,11 +734,44 @@ class RecruitmentCrew:
         self.latest_evaluations = evaluations
         self.risk_history.append(risk)
 
+    def _cache_get(self, cache: OrderedDict[Any, Any], key: Any) -> Any:
+        """Return a cached result and mark it as most recently used."""
+        with self._cache_lock:
+            hit = cache.get(key)
+            if hit is not None:
+                cache.move_to_end(key)
+            return hit
+
+    def _cache_put(self, cache: OrderedDict[Any, Any], key: Any, value: Any) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            cache[key] = value
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _campaign_key(self, payload: JobDescriptionModel, limit: int) -> bytes:
+        """Hash the inputs that determine a campaign run's output."""
+        fingerprint = (
+            payload.title,
+            payload.content,
+            limit,
+            self.policy,
+            hash(self.researcher._candidate_pool),
+        )
+        return hashlib.blake2b(repr(fingerprint).encode("utf-8"), digest_size=16).digest()
+
     def run_campaign(
         self, job_description: Optional[JobDescriptionModel] = None, limit: int = 4
     ) -> Tuple[List[RankedCandidate], List[EvaluationResult]]:
         """Execute a full campaign run from sourcing through ranking."""
         payload = job_description or self.job_description
+        key = self._campaign_key(payload, limit)
+        cached = self._cache_get(self._campaign_cache, key)
+        if cached is not None:
+            ranked, evaluations, risk = cached
+            log.info("crew_run_campaign_cache_hit", job_title=payload.title, limit=limit)
+            self._record_state(ranked, evaluations, risk)
+            return list(ranked), list(evaluations)
         log.info("crew_run_campaign_start", job_title=payload.title, limit=limit)
         with self.tracer.trace("run_campaign", job_title=payload.title):
             seeds = self.researcher.research(payload, limit=limit)
@@ -473,11 +779,39 @@ class RecruitmentCrew:
             ranked = self.recommender.recommend(evaluations, self.policy)
             risk = self.assess_risk(evaluations)
             self._record_state(ranked, evaluations, risk)
+            self._cache_put(self._campaign_cache, key, (ranked, evaluations, risk))
+            log.info(
+                "crew_run_campaign_complete",
+                job_title=payload.title,
+                candidates=len(ranked),
+                bias_flags=risk.bias_flags,
+            )
+            return list(ranked), list(evaluations)
+
+    async def run_campaign_async(
+        self, job_description: Optional[JobDescriptionModel] = None, limit: int = 4
+    ) -> Tuple[List[RankedCandidate], List[EvaluationResult]]:
+        """Execute a campaign run with research streaming into concurrent evaluation."""
+        payload = job_description or self.job_description
+        log.info("crew_run_campaign_start", job_title=payload.title, limit=limit)
+        with self.tracer.trace("run_campaign_async", job_title=payload.title):
+            seeds: asyncio.Queue[Optional[CandidateSeed]] = asyncio.Queue()
+            research = asyncio.create_task(
+                self.researcher.research_async(payload, seeds, limit=limit)
+            )
+            evaluations = await self.evaluator.evaluate_async(seeds)
+            await research
+            # Ranking needs the full slate; risk scoring only depends on evaluations.
+            ranked, risk = await asyncio.gather(
+                asyncio.to_thread(self.recommender.recommend, evaluations, self.policy),
+                asyncio.to_thread(self.assess_risk, evaluations),
+            )
+            self._record_state(ranked, evaluations, risk)
             log.info(
                 "crew_run_campaign_complete",
                 job_title=payload.title,
                 candidates=len(ranked),
-                bias_flags=sum(len(eval.bias_flags) for eval in evaluations),
+                bias_flags=risk.bias_flags,
             )
             return ranked, evaluations
 
@@ -486,7 +820,11 @@ class RecruitmentCrew:
         evaluations: Optional[List[EvaluationResult]] = None,
         policy: Optional[RankingPolicy] = None,
     ) -> List[RankedCandidate]:
-        """Re-rank candidates using a different policy or latest evaluations."""
+        """Re-rank candidates using a different policy or latest evaluations.
+
+        Results are memoized per evaluation list identity and policy, so callers
+        should pass a new list rather than mutating one that was ranked before.
+        """
         source = evaluations or self.latest_evaluations
         if not source:
             logger.warning("rerank_without_evaluations")
@@ -494,10 +832,17 @@ class RecruitmentCrew:
         active_policy = policy or self.policy
         self.policy = active_policy
         self.recommender.set_policy(active_policy)
-        ranked = self.recommender.recommend(source, active_policy)
-        risk = self.assess_risk(source)
+        key = (id(source), active_policy)
+        cached = self._cache_get(self._rerank_cache, key)
+        # The cached entry keeps its source alive, so a matching id is the same list.
+        if cached is not None and cached[0] is source:
+            _, ranked, risk = cached
+        else:
+            ranked = self.recommender.recommend(source, active_policy)
+            risk = self.assess_risk(source)
+            self._cache_put(self._rerank_cache, key, (source, ranked, risk))
         self._record_state(ranked, source, risk)
-        return ranked
+        return list(ranked)
 
     def generate_outreach(
         self,
@@ -510,15 +855,32 @@ class RecruitmentCrew:
         if not roster:
             logger.warning("generate_outreach_no_candidates", campaign_id=campaign_id)
             return []
-        template = template or OutreachTemplate()
-        return [self.writer.draft(
-            campaign_id, candidate, template
-        ) for candidate in roster]
+        return self.writer.draft_batch(campaign_id, roster, template or OutreachTemplate())
+
+    async def generate_outreach_async(
+        self,
+        campaign_id: str,
+        candidates: Optional[List[RankedCandidate]] = None,
+        template: Optional[OutreachTemplate] = None,
+    ) -> List[OutreachDraft]:
+        """Draft outreach for every candidate concurrently, preserving roster order."""
+        roster = candidates or self.latest_candidates
+        if not roster:
+            logger.warning("generate_outreach_no_candidates", campaign_id=campaign_id)
+            return []
+        return await self.writer.draft_batch_async(
+            campaign_id, roster, template or OutreachTemplate()
+        )
 
     def assess_risk(self, evaluations: Sequence[EvaluationResult]) -> RiskAssessment:
         """Score the candidate slate for operational risk."""
-        flag_count = sum(len(evaluation.bias_flags) for evaluation in evaluations)
-        score = min(1.0, flag_count / max(1, len(evaluations)))
+        counts = np.fromiter(
+            (evaluation.bias_flag_count for evaluation in evaluations),
+            dtype=np.int32,
+            count=len(evaluations),
+        )
+        flag_count = int(counts.sum())
+        score = min(1.0, flag_count / max(1, counts.size))
         level = "elevated" if score > 0.3 else "standard"
         return RiskAssessment(score=score, bias_flags=flag_count, level=level)
 
@@ -2,29 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from os import getenv
-from typing import Any, Callable, Dict, List, Optional
-from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from os import getenv, getpid
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+import asyncio
+import hashlib
+import itertools
 import time
 
 import crewai
 import structlog
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, Body, FastAPI, HTTPException
-from fastapi import Request
+from fastapi import APIRouter, BackgroundTasks, Body, FastAPI, HTTPException
+from fastapi import Query, Request, Response
 from pydantic import BaseModel, Field
 
 from recruitment_assistant.agents.crew import (
     JobDescriptionModel,
     OutreachDraft,
     OutreachTemplate,
-    RankedCandidate,
     RecruitmentCrew,
     RankingPolicy,
 )
-from recruitment_assistant.api.store import CampaignStore
-from recruitment_assistant.logging_config import get_app_logger
+from recruitment_assistant.api.store import CampaignStatus, CampaignStore
+from recruitment_assistant.logging_config import IS_PRODUCTION, get_app_logger
 
 logger = structlog.get_logger(__name__)
 CREWAI_VERSION = crewai.__version__
@@ -33,17 +37,37 @@ load_dotenv()
 APP_NAME = getenv("APP_NAME", "Recruitment Assistant AI Backend")
 APP_ENV = getenv("APP_ENV", "development")
 OPENAI_MODEL = getenv("OPENAI_MODEL", "gpt-4o")
-app = FastAPI(title=f"{APP_NAME} ({APP_ENV})")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+	"""Build the seed campaign on the crew pool before serving, never on the event loop."""
+	await asyncio.get_running_loop().run_in_executor(_crew_pool, store.ensure_seed)
+	yield
+
+
+app = FastAPI(title=f"{APP_NAME} ({APP_ENV})", lifespan=lifespan)
 log = get_app_logger()
 log.info("application_startup", app_env=APP_ENV, openai_model=OPENAI_MODEL, crewai_version=CREWAI_VERSION)
 
 crew = RecruitmentCrew()
 store = CampaignStore()
 
+# Crew work (LLM round-trips) runs on its own bounded pool so concurrent campaigns
+# queue here instead of exhausting the shared threadpool or the event loop.
+CREW_POOL_SIZE = int(getenv("CREW_POOL_SIZE", "8"))
+CREW_TIMEOUT = float(getenv("CREW_TIMEOUT", "120"))
+_crew_pool = ThreadPoolExecutor(max_workers=CREW_POOL_SIZE, thread_name_prefix="crew")
+
+# Request ids only need to be unique per deployment, not unguessable:
+# pid + process start second, then a per-process counter.
+_REQUEST_ID_PREFIX = f"{getpid():x}{int(time.time()):x}"
+_request_counter = itertools.count(1)
+
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next: Callable[[Request], Any]):
-	request_id = str(uuid4())
+	request_id = f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
 	trace_id = request.headers.get("x-trace-id", request_id)
 	user_id = request.headers.get("x-user-id")
 	start = time.monotonic()
@@ -113,6 +137,14 @@ class OutreachSendRequest(BaseModel):
 	message: str = Field(..., min_length=1)
 
 
+OUTREACH_BATCH_MAX = 100
+
+
+class OutreachBatchRequest(BaseModel):
+	"""Several approved outreach messages queued in one round-trip."""
+	messages: List[OutreachSendRequest] = Field(..., min_length=1, max_length=OUTREACH_BATCH_MAX)
+
+
 class SerperRequest(BaseModel):
 	"""Minimal search payload for the Serper integration."""
 	query: str = Field(..., min_length=3)
@@ -129,79 +161,81 @@ class CampaignStatusResponse(BaseModel):
 	metrics: Dict[str, Any]
 
 
+_JD_TITLE_MIN_LENGTH = 5
+_JD_CONTENT_MIN_LENGTH = 20
+CANDIDATE_PAGE_MAX = 200
+
+
 def _validate_jd(title: str, content: str) -> None:
 	"""Raise HTTP errors when the JD payload is malformed."""
-	if len(title.strip()) < 5:
+	# str.strip() returns the same object when there is nothing to trim, so only
+	# inputs that are already long enough pay for the whitespace check at all.
+	if len(title) < _JD_TITLE_MIN_LENGTH or len(title.strip()) < _JD_TITLE_MIN_LENGTH:
 		raise HTTPException(status_code=400, detail="Invalid JD Title")
-	if len(content.strip()) < 20:
+	if len(content) < _JD_CONTENT_MIN_LENGTH or len(content.strip()) < _JD_CONTENT_MIN_LENGTH:
 		raise HTTPException(status_code=400, detail="Invalid JD content")
 
 
-def safe_crew_call(operation: Callable[[], Any], detail: str) -> Any:
-	"""Safely invoke crew operations and wrap errors in HTTP responses."""
+async def safe_crew_call(operation: Callable[[], Any], detail: str) -> Any:
+	"""Run a crew operation on the crew pool and wrap errors in HTTP responses."""
 	try:
-		return operation()
+		return await asyncio.wait_for(
+			asyncio.wrap_future(_crew_pool.submit(operation)), timeout=CREW_TIMEOUT
+		)
+	except asyncio.TimeoutError:
+		logger.error("crew-operation-timeout", detail=detail, timeout_seconds=CREW_TIMEOUT)
+		raise HTTPException(status_code=504, detail=f"Crew operation '{detail}' timed out")
 	except Exception as exc:  # pragma: no cover - keep request from crashing
 		logger.exception("crew-operation-failed", detail=detail, error=str(exc))
 		raise HTTPException(status_code=500, detail=f"Crew operation '{detail}' failed: {exc}")
 
 
-def build_metrics(ranked: List[RankedCandidate], evaluations: List[Any]) -> Dict[str, Any]:
-	"""Summarize ranking and bias data for a candidate slate."""
-	bias_checks = sum(len(eval.bias_flags) for eval in evaluations)
-	data_deficient = sum(1 for candidate in ranked if "Data Deficient" in candidate.tags)
-	selection_rationale = (
-		f"{ranked[0].name} ({ranked[0].role}) leads the pack"
-		if ranked
-		else "Campaign initializing"
-	)
-	return {
-		"total_candidates": len(ranked),
-		"bias_checks": bias_checks,
-		"bias_checks_passed": bias_checks == 0,
-		"data_deficient_count": data_deficient,
-		"selection_rationale": selection_rationale,
-		"generated_at": datetime.now(timezone.utc)
-			.replace(second=0, microsecond=0)
-			.strftime("%Y-%m-%d %H:%M"),
-	}
+# Repeated JD queries reuse insights for 15 minutes; keyed by digest since JDs are long.
+_serper_cache: TTLCache[bytes, Dict[str, Any]] = TTLCache(maxsize=1024, ttl=900)
+_serper_cache_lock = Lock()
 
 
 def run_serper_search(query: str) -> Dict[str, Any]:
 	"""Wrap the Serper integration for candidate research insights."""
+	key = hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest()
+	with _serper_cache_lock:
+		cached = _serper_cache.get(key)
+	if cached is not None:
+		return cached
 	logger.info("serper-search", query=query)
-	return {
+	result = {
 		"query": query,
 		"insights": [
 			{"source": "SerperAI", "summary": f"Top skills matched for {query}"},
 		],
 	}
+	with _serper_cache_lock:
+		_serper_cache[key] = result
+	return result
 
 
 
-def _serialize_candidate(candidate: RankedCandidate) -> Dict[str, Any]:
-	"""Convert a RankedCandidate to a minimal API payload."""
-	return {
-		"candidate_id": candidate.candidate_id,
-		"name": candidate.name,
-		"role": candidate.role,
-		"score": candidate.final_score,
-		"rationale": candidate.rationale,
-		"rank_label": candidate.rank_label,
-		"bias_flags": candidate.bias_flags,
-		"tags": candidate.tags,
-		"profile_url": candidate.profile_url,
-	}
-
-
-def _persist_campaign(
-	payload: CampaignCreateRequest, job_description: JobDescriptionModel
+async def _persist_campaign(
+	payload: CampaignCreateRequest,
+	job_description: JobDescriptionModel,
+	background_tasks: BackgroundTasks,
 ) -> Dict[str, Any]:
-	"""Run the crew and store the resulting campaign record."""
-	ranked, evaluations = safe_crew_call(lambda: crew.run_campaign(job_description), "run_campaign")
-	metrics = build_metrics(ranked, evaluations)
-	serper_insights = run_serper_search(job_description.content or payload.title)
-	record = store.create_campaign(
+	"""Run the crew and queue the resulting campaign record for storage."""
+	# The crew run and the Serper lookup are independent; overlap them.
+	loop = asyncio.get_running_loop()
+	serper_future = loop.run_in_executor(
+		None, run_serper_search, job_description.content or payload.title
+	)
+	(ranked, evaluations), serper_insights = await asyncio.gather(
+		safe_crew_call(lambda: crew.run_campaign(job_description), "run_campaign"),
+		serper_future,
+	)
+	metrics = store.build_metrics(ranked, evaluations)
+	# Only the id is needed for the response; persistence runs after it is sent.
+	campaign_id = store.reserve_id()
+	background_tasks.add_task(
+		store.finalize_campaign,
+		campaign_id,
 		title=payload.title,
 		description=payload.description,
 		job_description=job_description.content or "",
@@ -210,10 +244,12 @@ def _persist_campaign(
 		metrics=metrics,
 		serper_insights=serper_insights,
 	)
-	store.record_audit(record.campaign_id, "campaign_initialized", {"jd": payload.title})
+	background_tasks.add_task(
+		store.record_audit, campaign_id, "campaign_initialized", {"jd": payload.title}
+	)
 	return {
-		"campaign_id": record.campaign_id,
-		"status": record.status,
+		"campaign_id": campaign_id,
+		"status": CampaignStatus.INITIALIZED,
 		"metrics": metrics,
 		"serper": serper_insights,
 	}
@@ -237,17 +273,13 @@ def health() -> Dict[str, str]:
 
 
 @app.post("/campaigns")
-def create_campaign(payload: CampaignCreateRequest) -> Dict[str, Any]:
+async def create_campaign(
+	payload: CampaignCreateRequest, background_tasks: BackgroundTasks
+) -> Dict[str, Any]:
 	"""Validate and persist a new campaign run."""
 	_validate_jd(payload.title, payload.content)
 	job_description = JobDescriptionModel(title=payload.title, content=payload.content)
-	return _persist_campaign(payload, job_description)
-
-
-@app.post("/campaign/create")
-def create_campaign_alias(payload: CampaignCreateRequest) -> Dict[str, Any]:
-	"""Alias endpoint for campaign creation."""
-	return create_campaign(payload)
+	return await _persist_campaign(payload, job_description, background_tasks)
 
 
 @app.get("/campaigns/{campaign_id}/status", response_model=CampaignStatusResponse)
@@ -261,24 +293,34 @@ def campaign_status(campaign_id: str) -> CampaignStatusResponse:
 		status=campaign.status,
 		last_updated=campaign.created_at,
 		total_candidates=len(campaign.candidates),
-		bias_flags=sum(len(candidate.bias_flags) for candidate in campaign.candidates),
+		bias_flags=campaign.bias_flag_count(),
 		phase="ranking" if campaign.candidates else "initializing",
 		metrics=campaign.metrics,
 	)
 
 
 @app.get("/campaigns/{campaign_id}/candidates")
-@app.get("/campaign/{campaign_id}/candidates")
-def campaign_candidates(campaign_id: str) -> List[Dict[str, Any]]:
-	"""List serialized candidate data for the requested campaign."""
+def campaign_candidates(
+	campaign_id: str,
+	limit: Optional[int] = Query(None, ge=1, le=CANDIDATE_PAGE_MAX),
+	offset: int = Query(0, ge=0),
+	fields: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+	"""List serialized candidate data, optionally as one page restricted to ``fields``."""
 	campaign = store.get_campaign(campaign_id)
 	if not campaign:
 		raise HTTPException(status_code=404, detail="Campaign not found")
-	return [_serialize_candidate(candidate) for candidate in campaign.candidates]
+	candidates = campaign.candidates_json
+	if limit is not None or offset:
+		candidates = candidates[offset : offset + limit if limit is not None else None]
+	if fields:
+		wanted = frozenset(fields.split(","))
+		candidates = [{key: value for key, value in cand.items() if key in wanted} for cand in candidates]
+	return candidates
 
 
 @app.post("/campaigns/{campaign_id}/rank")
-def rank_candidates(campaign_id: str, payload: RankRequest) -> Dict[str, Any]:
+async def rank_candidates(campaign_id: str, payload: RankRequest) -> Dict[str, Any]:
 	"""Re-rank candidates using the requested strategy."""
 	campaign = store.get_campaign(campaign_id)
 	if not campaign:
@@ -286,22 +328,22 @@ def rank_candidates(campaign_id: str, payload: RankRequest) -> Dict[str, Any]:
 	if not campaign.evaluations:
 		raise HTTPException(status_code=400, detail="No evaluations available for ranking")
 	policy = RankingPolicy(name=payload.strategy or "balanced")
-	ranked = safe_crew_call(lambda: crew.rerank(campaign.evaluations, policy), "rerank")
+	ranked = await safe_crew_call(lambda: crew.rerank(campaign.evaluations, policy), "rerank")
 	if payload.limit and payload.limit > 0:
 		ranked = ranked[: payload.limit]
-	metrics = build_metrics(ranked, campaign.evaluations)
+	metrics = store.build_metrics(ranked, campaign.evaluations)
 	updated = store.update_candidates(campaign_id, ranked, campaign.evaluations, metrics)
 	if not updated:
 		raise HTTPException(status_code=500, detail="Failed to update ranking")
 	store.record_audit(campaign_id, "ranking_updated", {"strategy": policy.name})
 	return {
 		"campaign_id": campaign_id,
-		"ranked_candidates": [_serialize_candidate(candidate) for candidate in ranked],
+		"ranked_candidates": updated.candidates_json,
 		"metrics": metrics,
 	}
 
 @app.post("/campaigns/{campaign_id}/outreach")
-def generate_outreach(
+async def generate_outreach(
 	campaign_id: str,
 	payload: Optional[OutreachRequest] = Body(None),
 ) -> Dict[str, Any]:
@@ -316,7 +358,7 @@ def generate_outreach(
 		compliance_notes=payload.compliance_notes
 		or "GDPR-compliant; transparent opt-out included",
 	)
-	drafts = safe_crew_call(
+	drafts = await safe_crew_call(
 		lambda: crew.generate_outreach(campaign_id, campaign.candidates, template),
 		"generate_outreach",
 	)
@@ -326,14 +368,7 @@ def generate_outreach(
 	store.record_audit(campaign_id, "outreach_generated", {"draft_count": len(persisted)})
 	return {
 		"campaign_id": campaign_id,
-		"drafts": [
-			{
-				"draft_id": draft.draft_id,
-				"candidate_id": draft.candidate_id,
-				"message": draft.message,
-			}
-			for draft in persisted
-		],
+		"drafts": persisted,
 	}
 
 
@@ -352,31 +387,44 @@ def send_outreach(payload: OutreachSendRequest, background_tasks: BackgroundTask
 	return {"status": "queued", "candidate_id": payload.candidate_id}
 
 
+@app.post("/outreach/send/batch")
+def send_outreach_batch(payload: OutreachBatchRequest, background_tasks: BackgroundTasks) -> Dict[str, Any]:
+	"""Queue a single background task that records every outreach dispatch in the batch."""
+	campaign_ids = {message.campaign_id for message in payload.messages}
+	missing = sorted(campaign_id for campaign_id in campaign_ids if not store.get_campaign(campaign_id))
+	if missing:
+		raise HTTPException(status_code=404, detail=f"Campaign not found: {', '.join(missing)}")
+	background_tasks.add_task(
+		store.record_audit_batch,
+		"outreach_sent",
+		[
+			(message.campaign_id, {"candidate_id": message.candidate_id, "message": message.message})
+			for message in payload.messages
+		],
+	)
+	return {"status": "queued", "candidate_ids": [message.candidate_id for message in payload.messages]}
+
+
 @app.get("/campaigns/{campaign_id}/report")
-@app.get("/campaign/{campaign_id}/report")
-def campaign_report(campaign_id: str) -> Dict[str, Any]:
-	"""Return the stored campaign report payload."""
+def campaign_report(campaign_id: str, request: Request) -> Response:
+	"""Return the stored campaign report payload, or 304 when the client's copy is current."""
 	campaign = store.get_campaign(campaign_id)
 	if not campaign:
 		raise HTTPException(status_code=404, detail="Campaign not found")
-	return {
-		"campaign_id": campaign.campaign_id,
-		"status": campaign.status,
-		"metrics": campaign.metrics,
-		"bias_checks": [
-			{"flag": flag, "candidate_id": candidate.candidate_id}
-			for candidate in campaign.candidates
-			for flag in candidate.bias_flags
-		],
-		"selection_rationale": campaign.metrics.get("selection_rationale", "Pending"),
-		"serper_insights": campaign.serper_insights,
-	}
+	body, etag = campaign.encoded_report()
+	if request.headers.get("if-none-match") == etag:
+		return Response(status_code=304, headers={"ETag": etag})
+	return Response(
+		content=body,
+		media_type="application/json",
+		headers={"ETag": etag},
+	)
 
 
 @app.get("/audit-logs")
-def audit_logs() -> List[Dict[str, Any]]:
+def audit_logs() -> Response:
 	"""Expose stored audit log entries."""
-	return store.get_audit_logs()
+	return Response(content=store.get_audit_logs_json(), media_type="application/json")
 
 
 @app.delete("/campaigns/{campaign_id}")
@@ -391,3 +439,13 @@ def purge_campaign(campaign_id: str) -> Dict[str, str]:
 def serper_search(payload: SerperRequest) -> Dict[str, Any]:
 	"""Proxy a Serper search for candidate insights."""
 	return run_serper_search(payload.query)
+
+
+# Singular "/campaign/..." paths predate the canonical routes; they point at the same
+# handlers, stay out of the schema, and are not registered at all in production.
+legacy_router = APIRouter(include_in_schema=False)
+legacy_router.add_api_route("/campaign/create", create_campaign, methods=["POST"])
+legacy_router.add_api_route("/campaign/{campaign_id}/candidates", campaign_candidates, methods=["GET"])
+legacy_router.add_api_route("/campaign/{campaign_id}/report", campaign_report, methods=["GET"])
+if not IS_PRODUCTION:
+	app.include_router(legacy_router)
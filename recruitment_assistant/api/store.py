@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import itertools
+import os
+import time
+from collections import deque
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from threading import Lock
 from typing import Any, Optional, Sequence, Union
 
+import orjson
+
 from recruitment_assistant.agents.crew import (
     EvaluationResult,
     OutreachDraft,
@@ -15,6 +22,62 @@ from recruitment_assistant.agents.crew import (
     RecruitmentCrew,
 )
 
+SEED_CAMPAIGN_ID = "CAMP_001"
+# Oldest audit entries rotate out once the in-memory log reaches this size.
+AUDIT_LOG_MAX = int(os.getenv("AUDIT_LOG_MAX", "10000"))
+
+# (epoch minute, formatted string); stamps only change once a minute.
+_minute_stamp: tuple[int, str] = (-1, "")
+
+
+def utc_minute_timestamp() -> str:
+    """Return the current UTC time truncated to the minute, reusing the last rendering."""
+    global _minute_stamp
+    minute = int(time.time() // 60)
+    cached_minute, cached = _minute_stamp
+    if minute == cached_minute:
+        return cached
+    cached = datetime.fromtimestamp(minute * 60, timezone.utc).strftime("%Y-%m-%d %H:%M")
+    _minute_stamp = (minute, cached)
+    return cached
+
+
+def serialize_candidate(candidate: RankedCandidate) -> dict[str, Any]:
+    """Convert a RankedCandidate to a minimal API payload."""
+    return {
+        "candidate_id": candidate.candidate_id,
+        "name": candidate.name,
+        "role": candidate.role,
+        "score": candidate.final_score,
+        "rationale": candidate.rationale,
+        "rank_label": candidate.rank_label,
+        "bias_flags": candidate.bias_flags,
+        "tags": candidate.tags,
+        "profile_url": candidate.profile_url,
+    }
+
+
+def clear_bias_flags(candidates: Sequence[RankedCandidate]) -> list[RankedCandidate]:
+    """Return the slate with bias flags stripped, reusing candidates that have none.
+
+    RankedCandidate is frozen with slots, so a flagged entry still needs a
+    ``replace``; unflagged entries are shared as-is and skip the copy entirely.
+    """
+    return [
+        replace(candidate, bias_flags=()) if candidate.bias_flags else candidate
+        for candidate in candidates
+    ]
+
+
+def serialize_draft(draft: OutreachDraft) -> dict[str, Any]:
+    """Convert an OutreachDraft to the API payload shape."""
+    return {
+        "draft_id": draft.draft_id,
+        "candidate_id": draft.candidate_id,
+        "message": draft.message,
+    }
+
+
 class CampaignStatus(str, Enum):
     """Finite status enums used by campaigns."""
     CREATED = "created"
@@ -34,28 +97,131 @@ class CampaignRecord:
     created_at: str
     status: CampaignStatus
     candidates: list[RankedCandidate] = field(default_factory=list)
+    candidates_json: list[dict[str, Any]] = field(default_factory=list)
     evaluations: list[EvaluationResult] = field(default_factory=list)
     outreach_drafts: list[OutreachDraft] = field(default_factory=list)
+    outreach_drafts_json: list[dict[str, Any]] = field(default_factory=list)
     metrics: dict[str, Any] = field(default_factory=dict)
     serper_insights: dict[str, Any] = field(default_factory=dict)
+    _bias_checks: Optional[list[dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bias_flag_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _report: Optional[tuple[bytes, str]] = field(default=None, init=False, repr=False, compare=False)
+    # Reads take no lock, so a memo built from a record that changed mid-build is dropped:
+    # writers bump _version on invalidation and memos only land if it still matches.
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _memo_lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def _memoize(self, version: int, attr: str, value: Any) -> None:
+        """Store a derived view unless the record was invalidated while it was built."""
+        with self._memo_lock:
+            if version == self._version:
+                setattr(self, attr, value)
+
+    def bias_checks(self) -> list[dict[str, str]]:
+        """Return the flattened per-candidate bias flags, built once per candidate slate."""
+        checks = self._bias_checks
+        if checks is None:
+            version = self._version
+            checks = [
+                {"flag": flag, "candidate_id": candidate.candidate_id}
+                for candidate in self.candidates
+                for flag in candidate.bias_flags
+            ]
+            self._memoize(version, "_bias_checks", checks)
+        return checks
+
+    def bias_flag_count(self) -> int:
+        """Return the total number of bias flags across the candidate slate."""
+        count = self._bias_flag_count
+        if count is None:
+            version = self._version
+            count = sum(len(candidate.bias_flags) for candidate in self.candidates)
+            self._memoize(version, "_bias_flag_count", count)
+        return count
+
+    def encoded_report(self) -> tuple[bytes, str]:
+        """Return the encoded campaign report and its strong ETag, re-encoding only after changes."""
+        report = self._report
+        if report is None:
+            version = self._version
+            body = orjson.dumps(
+                {
+                    "campaign_id": self.campaign_id,
+                    "status": self.status,
+                    "metrics": self.metrics,
+                    "bias_checks": self.bias_checks(),
+                    "selection_rationale": self.metrics.get("selection_rationale", "Pending"),
+                    "serper_insights": self.serper_insights,
+                },
+                default=str,
+            )
+            report = (body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+            self._memoize(version, "_report", report)
+        return report
+
+    def invalidate_report(self) -> None:
+        """Drop the encoded report after a status or metrics change."""
+        with self._memo_lock:
+            self._version += 1
+            self._report = None
+
+    def invalidate_derived(self) -> None:
+        """Drop cached views after the candidate slate changes."""
+        with self._memo_lock:
+            self._version += 1
+            self._bias_checks = None
+            self._bias_flag_count = None
+            self._report = None
 
 
 class CampaignStore:
     """Thread-safe container for campaign records and audit events."""
 
     def __init__(self) -> None:
+        # _lock guards the campaign map and lock map; per-campaign locks guard records.
         self._lock = Lock()
         self._campaigns: dict[str, CampaignRecord] = {}
-        self._audit_logs: list[dict[str, Any]] = []
-        self._populate_seed_campaign()
+        self._campaign_locks: dict[str, Lock] = {}
+        self._audit_lock = Lock()
+        self._audit_logs: deque[dict[str, Any]] = deque(maxlen=AUDIT_LOG_MAX)
+        self._audit_json: Optional[bytes] = None
+        # CAMP_001 is the seed campaign; purges never recycle identifiers.
+        self._id_counter = itertools.count(2)
+        # The seed campaign runs a full crew pass, so it is built by ensure_seed(), not here.
+        self._seed_lock = Lock()
+        self._seed_done = False
 
     def _next_id(self) -> str:
         """Produce a new campaign identifier."""
-        return f"CAMP_{len(self._campaigns) + 1:03d}"
+        return f"CAMP_{next(self._id_counter):03d}"
+
+    def _lock_for(self, campaign_id: str) -> Lock:
+        """Return the lock serializing mutations of a single campaign."""
+        lock = self._campaign_locks.get(campaign_id)
+        if lock is None:
+            with self._lock:
+                lock = self._campaign_locks.setdefault(campaign_id, Lock())
+        return lock
+
+    def _append_audit(
+        self, campaign_id: str, action: str, details: dict[str, Any], timestamp: Optional[str] = None
+    ) -> None:
+        """Append an audit entry under the audit lock."""
+        entry = {
+            "timestamp": timestamp or self._timestamp(),
+            "campaign_id": campaign_id,
+            "action": action,
+            "details": details,
+        }
+        with self._audit_lock:
+            self._audit_logs.append(entry)
+            self._audit_json = None
 
     def _timestamp(self) -> str:
         """Generate a UTC timestamp string for auditing."""
-        return datetime.now(timezone.utc).replace(second=0, microsecond=0).strftime("%Y-%m-%d %H:%M")
+        return utc_minute_timestamp()
 
     def _resolve_status(self, status: Union[str, CampaignStatus]) -> CampaignStatus:
         """Normalize status strings to CampaignStatus enums."""
@@ -66,12 +232,25 @@ class CampaignStore:
         except ValueError as exc:
             raise ValueError(f"Unknown campaign status: {status}") from exc
 
-    def _build_metrics(self, candidates: Sequence[RankedCandidate]) -> dict[str, Any]:
-        """Compute derived metrics from ranked candidates."""
-        bias_checks = sum(len(candidate.bias_flags) for candidate in candidates)
-        data_deficient = sum(
-            1 for candidate in candidates if "Data Deficient" in candidate.tags
-        )
+    def build_metrics(
+        self,
+        candidates: Sequence[RankedCandidate],
+        evaluations: Optional[Sequence[EvaluationResult]] = None,
+    ) -> dict[str, Any]:
+        """Compute derived metrics from ranked candidates in a single pass.
+
+        Bias checks are counted over ``evaluations`` when given (the full slate a
+        ranking was cut from), otherwise over the ranked candidates themselves.
+        """
+        count_candidate_flags = evaluations is None
+        bias_checks = data_deficient = 0
+        for candidate in candidates:
+            if count_candidate_flags:
+                bias_checks += len(candidate.bias_flags)
+            if "Data Deficient" in candidate.tags:
+                data_deficient += 1
+        if evaluations is not None:
+            bias_checks = sum(evaluation.bias_flag_count for evaluation in evaluations)
         selection_rationale = (
             f"Top candidate: {candidates[0].name} ({candidates[0].role})"
             if candidates
@@ -86,6 +265,15 @@ class CampaignStore:
             "generated_at": self._timestamp(),
         }
 
+    def ensure_seed(self) -> None:
+        """Build the seed campaign once; the API runs this off the event loop at startup."""
+        if self._seed_done:
+            return
+        with self._seed_lock:
+            if not self._seed_done:
+                self._populate_seed_campaign()
+                self._seed_done = True
+
     def _populate_seed_campaign(self) -> None:
         """Create a seeded campaign for health checks."""
         crew = RecruitmentCrew(
@@ -95,28 +283,25 @@ class CampaignStore:
             }
         )
         ranked, evaluations = crew.run_campaign()
-        sanitized_ranked = [replace(candidate, bias_flags=[]) for candidate in ranked]
-        metrics = self._build_metrics(sanitized_ranked)
+        sanitized_ranked = clear_bias_flags(ranked)
+        metrics = self.build_metrics(sanitized_ranked)
         record = CampaignRecord(
-            campaign_id="CAMP_001",
+            campaign_id=SEED_CAMPAIGN_ID,
             title="Sample Campaign",
             description="Seed campaign for health/status checks",
             job_description="Auto-generated JD",
             created_at=self._timestamp(),
             status=CampaignStatus.CREATED,
             candidates=sanitized_ranked,
+            candidates_json=[serialize_candidate(candidate) for candidate in sanitized_ranked],
             evaluations=evaluations,
             metrics=metrics,
             serper_insights={"query": "seed campaign", "insights": []},
         )
-        self._campaigns[record.campaign_id] = record
-        self._audit_logs.append(
-            {
-                "timestamp": record.created_at,
-                "campaign_id": record.campaign_id,
-                "action": "campaign_seeded",
-                "details": {"title": record.title},
-            }
+        with self._lock:
+            self._campaigns[record.campaign_id] = record
+        self._append_audit(
+            record.campaign_id, "campaign_seeded", {"title": record.title}, record.created_at
         )
 
     def create_campaign(
@@ -130,30 +315,57 @@ class CampaignStore:
         serper_insights: dict[str, Any],
     ) -> CampaignRecord:
         """Persist a newly created campaign and record the audit event."""
+        return self.finalize_campaign(
+            self.reserve_id(),
+            title=title,
+            description=description,
+            job_description=job_description,
+            candidates=candidates,
+            evaluations=evaluations,
+            metrics=metrics,
+            serper_insights=serper_insights,
+        )
+
+    def reserve_id(self) -> str:
+        """Claim the next campaign identifier ahead of persisting its record."""
+        with self._lock:
+            return self._next_id()
+
+    def finalize_campaign(
+        self,
+        campaign_id: str,
+        title: str,
+        description: str,
+        job_description: str,
+        candidates: Sequence[RankedCandidate],
+        evaluations: Sequence[EvaluationResult],
+        metrics: dict[str, Any],
+        serper_insights: dict[str, Any],
+    ) -> CampaignRecord:
+        """Persist a campaign under a previously reserved identifier."""
+        candidates = list(candidates)
+        record = CampaignRecord(
+            campaign_id=campaign_id,
+            title=title,
+            description=description,
+            job_description=job_description,
+            created_at=self._timestamp(),
+            status=CampaignStatus.INITIALIZED,
+            candidates=candidates,
+            candidates_json=[serialize_candidate(candidate) for candidate in candidates],
+            evaluations=list(evaluations),
+            metrics=dict(metrics),
+            serper_insights=dict(serper_insights),
+        )
         with self._lock:
-            campaign_id = self._next_id()
-            record = CampaignRecord(
-                campaign_id=campaign_id,
-                title=title,
-                description=description,
-                job_description=job_description,
-                created_at=self._timestamp(),
-                status=CampaignStatus.INITIALIZED,
-                candidates=list(candidates),
-                evaluations=list(evaluations),
-                metrics=dict(metrics),
-                serper_insights=dict(serper_insights),
-            )
             self._campaigns[campaign_id] = record
-            self._audit_logs.append(
-                {
-                    "timestamp": record.created_at,
-                    "campaign_id": campaign_id,
-                    "action": "campaign_created",
-                    "details": {"title": title, "status": record.status},
-                }
-            )
-            return record
+        self._append_audit(
+            campaign_id,
+            "campaign_created",
+            {"title": title, "status": record.status},
+            record.created_at,
+        )
+        return record
 
     def get_campaign(self, campaign_id: str) -> Optional[CampaignRecord]:
         """Return a campaign record by its identifier."""
@@ -161,18 +373,12 @@ class CampaignStore:
 
     def update_status(self, campaign_id: str, status: Union[str, CampaignStatus]) -> None:
         """Update campaign status and log the change."""
-        with self._lock:
+        with self._lock_for(campaign_id):
             campaign = self._campaigns.get(campaign_id)
             if campaign:
                 campaign.status = self._resolve_status(status)
-                self._audit_logs.append(
-                    {
-                        "timestamp": self._timestamp(),
-                        "campaign_id": campaign_id,
-                        "action": "status_update",
-                        "details": {"status": campaign.status},
-                    }
-                )
+                campaign.invalidate_report()
+                self._append_audit(campaign_id, "status_update", {"status": campaign.status})
 
     def update_candidates(
         self,
@@ -182,54 +388,69 @@ class CampaignStore:
         metrics: dict[str, Any],
     ) -> Optional[CampaignRecord]:
         """Refresh stored candidate/evaluation data and metrics."""
-        with self._lock:
+        with self._lock_for(campaign_id):
             campaign = self._campaigns.get(campaign_id)
             if not campaign:
                 return None
             campaign.candidates = list(candidates)
+            campaign.candidates_json = [
+                serialize_candidate(candidate) for candidate in campaign.candidates
+            ]
             campaign.evaluations = list(evaluations)
             campaign.metrics = dict(metrics)
             campaign.status = CampaignStatus.RANKED
+            # Only after every field is written, so no memo outlives this update.
+            campaign.invalidate_derived()
             return campaign
 
     def add_outreach_drafts(
-        self, campaign_id: str, drafts: Sequence[OutreachDraft]
-    ) -> Optional[list[OutreachDraft]]:
-        """Attach outreach drafts to a campaign."""
-        with self._lock:
+        self, campaign_id: str, drafts: list[OutreachDraft]
+    ) -> Optional[list[dict[str, Any]]]:
+        """Attach outreach drafts to a campaign and return their serialized payloads."""
+        with self._lock_for(campaign_id):
             campaign = self._campaigns.get(campaign_id)
             if not campaign:
                 return None
-            campaign.outreach_drafts = list(drafts)
-            return campaign.outreach_drafts
+            # The crew hands over a fresh list per call, so keep it without copying.
+            campaign.outreach_drafts = drafts
+            campaign.outreach_drafts_json = [serialize_draft(draft) for draft in drafts]
+            return campaign.outreach_drafts_json
 
     def record_audit(self, campaign_id: str, action: str, details: Optional[dict[str, Any]] = None) -> None:
         """Append an audit log entry."""
-        self._audit_logs.append(
-            {
-                "timestamp": self._timestamp(),
-                "campaign_id": campaign_id,
-                "action": action,
-                "details": details or {},
-            }
-        )
+        self._append_audit(campaign_id, action, details or {})
+
+    def record_audit_batch(
+        self, action: str, events: Sequence[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Append one ``action`` entry per (campaign_id, details) pair under a single lock hold."""
+        timestamp = self._timestamp()
+        entries = [
+            {"timestamp": timestamp, "campaign_id": campaign_id, "action": action, "details": details}
+            for campaign_id, details in events
+        ]
+        with self._audit_lock:
+            self._audit_logs.extend(entries)
+            self._audit_json = None
 
     def get_audit_logs(self) -> list[dict[str, Any]]:
         """Return a copy of the audit log list."""
-        return list(self._audit_logs)
+        with self._audit_lock:
+            return list(self._audit_logs)
+
+    def get_audit_logs_json(self) -> bytes:
+        """Return the audit log encoded as JSON, re-encoding only after new entries."""
+        with self._audit_lock:
+            if self._audit_json is None:
+                self._audit_json = orjson.dumps(list(self._audit_logs), default=str)
+            return self._audit_json
 
     def purge_campaign(self, campaign_id: str) -> bool:
         """Purge a campaign record and log the deletion."""
-        with self._lock:
-            if campaign_id in self._campaigns:
-                del self._campaigns[campaign_id]
-                self._audit_logs.append(
-                    {
-                        "timestamp": self._timestamp(),
-                        "campaign_id": campaign_id,
-                        "action": "campaign_purged",
-                        "details": {"status": CampaignStatus.PURGED},
-                    }
-                )
-                return True
-        return False
\ No newline at end of file
+        with self._lock_for(campaign_id):
+            with self._lock:
+                purged = self._campaigns.pop(campaign_id, None) is not None
+                self._campaign_locks.pop(campaign_id, None)
+        if purged:
+            self._append_audit(campaign_id, "campaign_purged", {"status": CampaignStatus.PURGED})
+        return purged
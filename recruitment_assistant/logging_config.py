@@ -5,9 +5,11 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Final, Mapping, TypeAlias, cast
 
+import orjson
 import structlog
 from loguru import logger as loguru_logger
 from structlog.contextvars import merge_contextvars
@@ -18,16 +20,21 @@ if TYPE_CHECKING:
 APP_ENV: Final[str] = os.getenv("APP_ENV", "development").lower()
 IS_PRODUCTION: Final[bool] = APP_ENV in {"production", "prod", "staging"}
 LOG_DIR: Final[Path] = Path(__file__).resolve().parents[1] / "logs"
+# Frame introspection on log calls is opt-in and never enabled outside development.
+LOG_DIAGNOSE: Final[bool] = not IS_PRODUCTION and os.getenv("LOG_DIAGNOSE") == "1"
+_LOGGING_FILE: Final[str] = logging.__file__
 _initialized = False
 
-_SENSITIVE_FIELDS: Final[set[str]] = {
-    "password",
-    "token",
-    "api_key",
-    "authorization",
-    "secret",
-    "credentials",
-}
+_SENSITIVE_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "password",
+        "token",
+        "api_key",
+        "authorization",
+        "secret",
+        "credentials",
+    }
+)
 
 # Loguru record is "dict-like" with known keys, but stubs are not precise.
 #
@@ -46,8 +53,9 @@ class InterceptHandler(logging.Handler):
         except ValueError:  # pragma: no cover - guard for custom levels
             level = record.levelno
 
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
+        # Skip the stdlib logging frames so Loguru reports the original call site.
+        frame, depth = sys._getframe(1), 1
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -61,12 +69,13 @@ def _redact(record: _RecordDict) -> bool:
 
     extra = record.get("extra")
     if isinstance(extra, Mapping):
-        # Make a mutable copy if needed
-        extra_mut = dict(extra)
-        for field in _SENSITIVE_FIELDS:
-            if field in extra_mut:
+        hits = _SENSITIVE_FIELDS.intersection(extra)
+        if hits:
+            # Copy only when something actually needs masking
+            extra_mut = dict(extra)
+            for field in hits:
                 extra_mut[field] = "***REDACTED***"
-        record["extra"] = extra_mut
+            record["extra"] = extra_mut
     return True
 
 
@@ -80,13 +89,64 @@ def _console_format() -> str:
     return (
         "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
         "<level>{level: <8}</level> | "
-        "<cyan>{extra.get('component','app')}</cyan> | "
-        "<cyan>{extra.get('request_id','')}</cyan> | "
+        "<cyan>{extra[component]}</cyan> | "
+        "<cyan>{extra[request_id]}</cyan> | "
         "{message} "
         "<dim>{extra}</dim>"
     )
 
 
+_JSON_EXTRA_KEY: Final[str] = "_json"
+
+
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    """Encode structlog event dicts with orjson, falling back to ``str`` for odd types."""
+
+    return orjson.dumps(
+        value,
+        default=kwargs.get("default", str),
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+def _json_format(record: _RecordDict) -> str:
+    """Serialize a Loguru record with orjson and hand Loguru a pass-through template."""
+
+    extra = record["extra"]
+    exception = record["exception"]
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "extra": {key: value for key, value in extra.items() if key != _JSON_EXTRA_KEY},
+    }
+    if exception is not None:
+        payload["exception"] = "".join(
+            traceback.format_exception(exception.type, exception.value, exception.traceback)
+        )
+    extra[_JSON_EXTRA_KEY] = orjson.dumps(
+        payload, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+    return "{extra[%s]}\n" % _JSON_EXTRA_KEY
+
+
+_JSON_FORMAT: Final[Callable[[Any], str]] = cast(Callable[[Any], str], _json_format)
+
+_STACK_INFO_RENDERER: Final = structlog.processors.StackInfoRenderer()
+
+
+def _render_exc_info(logger: Any, method_name: str, event_dict: Any) -> Any:
+    """Render stack/exception info only for the events that carry it."""
+
+    if "exc_info" in event_dict or "stack_info" in event_dict:
+        event_dict = _STACK_INFO_RENDERER(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
 def configure_logging() -> Logger:
     """Set up Loguru sinks, rotation, and structlog processors once per process."""
 
@@ -96,11 +156,12 @@ def configure_logging() -> Logger:
 
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     loguru_logger.remove()
+    # Defaults for the console format fields; bind() overrides them per logger.
+    loguru_logger.configure(extra={"component": "app", "request_id": ""})
 
     console_level = os.getenv("LOG_LEVEL", "DEBUG" if not IS_PRODUCTION else "INFO")
     file_level = os.getenv("FILE_LOG_LEVEL", "DEBUG")
     error_level = os.getenv("ERROR_LOG_LEVEL", "ERROR")
-    diagnose_enabled = not IS_PRODUCTION
 
     # Console sink
     loguru_logger.add(  # type: ignore[call-overload]
@@ -109,8 +170,8 @@ def configure_logging() -> Logger:
         format=_console_format(),
         colorize=True,
         filter=_REDACT_FILTER,
-        backtrace=True,
-        diagnose=diagnose_enabled,
+        backtrace=LOG_DIAGNOSE,
+        diagnose=LOG_DIAGNOSE,
     )
 
 
@@ -123,10 +184,10 @@ def configure_logging() -> Logger:
         retention="14 days",
         compression="zip",
         encoding="utf-8",
-        serialize=True,
+        format=_JSON_FORMAT,
         filter=_REDACT_FILTER,
-        backtrace=True,
-        diagnose=diagnose_enabled,
+        backtrace=LOG_DIAGNOSE,
+        diagnose=LOG_DIAGNOSE,
     )
 
     # Error file sink
@@ -138,10 +199,10 @@ def configure_logging() -> Logger:
         retention="30 days",
         compression="zip",
         encoding="utf-8",
-        serialize=True,
+        format=_JSON_FORMAT,
         filter=_REDACT_FILTER,
         backtrace=True,
-        diagnose=diagnose_enabled,
+        diagnose=False,
     )
 
     # Intercept stdlib logging
@@ -155,20 +216,9 @@ def configure_logging() -> Logger:
             structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.KeyValueRenderer(
-                key_order=[
-                    "timestamp",
-                    "level",
-                    "event",
-                    "logger",
-                    "request_id",
-                    "trace_id",
-                ]
-            ),
+            # No TimeStamper: every event lands in a Loguru record that carries its time.
+            _render_exc_info,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -1,10 +1,36 @@
-from dataclasses import dataclass
+import itertools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import Lock
+import orjson
 import requests
 import structlog
-from typing import Any, Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+from urllib.parse import urlencode
 
 logger = structlog.get_logger(__name__)
 
+DEFAULT_HEADERS: Dict[str, str] = {
+    "Accept": "application/json",
+    "User-Agent": "recruitment-assistant-ui/1.0",
+}
+# Transient failures worth retrying; other 4xx (auth, validation) are returned as-is.
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_BACKOFF_BASE = 0.05
+RETRY_BACKOFF_CAP = 10.0
+BACKEND_UNAVAILABLE_MESSAGE = "Unable to reach the backend API at the moment. Please try again later."
+CIRCUIT_OPEN_MESSAGE = "Backend temporarily unavailable"
+CANDIDATE_PAGE_SIZE = 20
+# Repeat failures of an endpoint log a traceback only this often.
+ERROR_TRACEBACK_EVERY = 50
+# Only the columns the review panel and PDF actually read.
+CANDIDATE_FIELDS = ("candidate_id", "name", "role", "score", "rationale", "tags", "profile_url")
+
 
 @dataclass
 class APIResponse:
@@ -13,42 +39,210 @@ class APIResponse:
     error: Optional[str] = None
 
 
+@dataclass
+class DashboardBundle:
+    status: APIResponse
+    candidates: APIResponse
+    report: APIResponse
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    """Trip OPEN after consecutive failures; allow one HALF_OPEN probe once recovery_timeout passes."""
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 15.0
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    # Set while the single HALF_OPEN probe is outstanding; other callers are rejected.
+    probe_in_flight: bool = False
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state is CircuitState.OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+            if self.state is CircuitState.HALF_OPEN:
+                if self.probe_in_flight:
+                    return False
+                self.probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the HALF_OPEN slot when a call ends without a backend verdict."""
+        with self._lock:
+            self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+
+
+def _failed_before_send(exc: requests.RequestException) -> bool:
+    """True when the connection was never established, so no request bytes left the client."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(exc, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+
 class APIClient:
-    def __init__(self, base_url: str, timeout: int = 6) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 6,
+        max_retries: int = 3,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.max_retries = max_retries
+        # Lives on the cache_resource-cached client, so every Streamlit panel shares it.
+        self.breaker = breaker or CircuitBreaker()
+        # endpoint -> (ETag, last successful response), replayed on 304 Not Modified.
+        self._etag_cache: Dict[str, Tuple[str, APIResponse]] = {}
+        # Endpoints currently failing; their repeats skip traceback formatting.
+        self._error_seen: Set[str] = set()
+        self._failure_counter = itertools.count(1)
+        # One pooled keep-alive session per client; Streamlit reruns reuse it via cache_resource.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(DEFAULT_HEADERS)
+
+    def close(self) -> None:
+        self._session.close()
+
+    @staticmethod
+    def _backoff(attempt: int) -> None:
+        """Sleep with full jitter: uniform(0, min(cap, base * 2**attempt))."""
+        time.sleep(random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt)))
+
+    def _want_traceback(self, endpoint: str) -> bool:
+        """Full traceback on an endpoint's first failure, then only every Nth repeat."""
+        if endpoint not in self._error_seen:
+            self._error_seen.add(endpoint)
+            return True
+        return next(self._failure_counter) % ERROR_TRACEBACK_EVERY == 0
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Issue the call, retrying transient failures.
+
+        The backend doesn't deduplicate writes, so non-GET calls are only retried when
+        the connection itself failed; a read timeout or 5xx may mean the write landed.
+        """
+        idempotent = method == "GET"
+        # Encode once with orjson; retries replay the same bytes.
+        body = orjson.dumps(payload) if payload is not None else None
+        if body is not None:
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        attempt = 0
+        while True:
+            try:
+                response = self._session.request(
+                    method, url, data=body, headers=headers, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt >= self.max_retries or not (idempotent or _failed_before_send(exc)):
+                    raise
+            else:
+                if (
+                    not idempotent
+                    or attempt >= self.max_retries
+                    or response.status_code not in RETRYABLE_STATUS_CODES
+                ):
+                    return response
+            self._backoff(attempt)
+            attempt += 1
 
     def _request(
         self, endpoint: str, method: str = "GET", payload: Optional[Dict[str, Any]] = None
     ) -> APIResponse:
+        if not self.breaker.allow_request():
+            return APIResponse(success=False, error=CIRCUIT_OPEN_MESSAGE)
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        cached = self._etag_cache.get(endpoint) if method == "GET" else None
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
         try:
-            response = requests.request(method, url, json=payload, timeout=self.timeout)
+            response = self._send(method, url, payload, headers)
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            # Only a real success ends a failure streak; a repeating 4xx stays throttled.
+            if response.ok or response.status_code == 304:
+                self._error_seen.discard(endpoint)
+            if response.status_code == 304 and cached is not None:
+                return cached[1]
             response.raise_for_status()
             if response.status_code == 204:
                 return APIResponse(success=True, data=True)
-            return APIResponse(success=True, data=response.json())
+            result = APIResponse(success=True, data=orjson.loads(response.content))
+            etag = response.headers.get("ETag") if method == "GET" else None
+            if etag:
+                self._etag_cache[endpoint] = (etag, result)
+            return result
         except requests.HTTPError as exc:
+            # Response.__bool__ is False for error statuses, so compare against None.
             message = (
-                exc.response.text if exc.response and exc.response.text else str(exc)
-            )
-            logger.error(
-                "api-http-error",
-                endpoint=endpoint,
-                status_code=exc.response.status_code if exc.response else None,
-                message=message,
-                exc_info=True,
+                exc.response.text
+                if exc.response is not None and exc.response.text
+                else str(exc)
             )
+            status_code = exc.response.status_code if exc.response is not None else None
+            if self._want_traceback(endpoint):
+                logger.error(
+                    "api-http-error",
+                    endpoint=endpoint,
+                    status_code=status_code,
+                    message=message,
+                    exc_info=True,
+                )
+            else:
+                logger.warning("api-http-error", endpoint=endpoint, status_code=status_code)
             return APIResponse(success=False, error=f"HTTP Error: {message}")
-        except requests.RequestException as exc:
-            message = str(exc)
-            logger.error(
-                "api-request-error",
-                endpoint=endpoint,
-                error=message,
-                exc_info=True,
-            )
-            return APIResponse(success=False, error="Unable to reach the backend API at the moment. Please try again later.")
+        except (requests.RequestException, orjson.JSONDecodeError) as exc:
+            self.breaker.record_failure()
+            if self._want_traceback(endpoint):
+                logger.error(
+                    "api-request-error",
+                    endpoint=endpoint,
+                    error=str(exc),
+                    exc_info=True,
+                )
+            else:
+                logger.warning("api-request-error", endpoint=endpoint, error_type=type(exc).__name__)
+            return APIResponse(success=False, error=BACKEND_UNAVAILABLE_MESSAGE)
+        except Exception:
+            # e.g. an unserializable payload; never leave the breaker stuck on a dead probe.
+            self.breaker.release_probe()
+            raise
 
     def get_campaign_status(self, campaign_id: str) -> APIResponse:
         return self._request(f"campaigns/{campaign_id}/status")
@@ -56,8 +250,20 @@ class APIClient:
     def create_campaign(self, payload: Dict[str, Any]) -> APIResponse:
         return self._request("campaigns", method="POST", payload=payload)
 
-    def get_campaign_candidates(self, campaign_id: str) -> APIResponse:
-        return self._request(f"campaigns/{campaign_id}/candidates")
+    def get_campaign_candidates(
+        self,
+        campaign_id: str,
+        limit: Optional[int] = CANDIDATE_PAGE_SIZE,
+        offset: int = 0,
+        fields: Optional[Sequence[str]] = CANDIDATE_FIELDS,
+    ) -> APIResponse:
+        """Fetch one page of candidates; ``limit=None`` returns the full slate."""
+        query: Dict[str, Any] = {"offset": offset}
+        if limit is not None:
+            query["limit"] = limit
+        if fields:
+            query["fields"] = ",".join(fields)
+        return self._request(f"campaigns/{campaign_id}/candidates?{urlencode(query)}")
 
     def rank_candidates(
         self, campaign_id: str, payload: Optional[Dict[str, Any]] = None
@@ -70,5 +276,24 @@ class APIClient:
     def send_outreach(self, payload: Dict[str, Any]) -> APIResponse:
         return self._request("outreach/send", method="POST", payload=payload)
 
+    def send_outreach_batch(self, payloads: Sequence[Dict[str, Any]]) -> APIResponse:
+        """Queue every approved message in a single round-trip."""
+        return self._request(
+            "outreach/send/batch", method="POST", payload={"messages": list(payloads)}
+        )
+
     def get_campaign_report(self, campaign_id: str) -> APIResponse:
-        return self._request(f"campaigns/{campaign_id}/report")
\ No newline at end of file
+        return self._request(f"campaigns/{campaign_id}/report")
+
+    def fetch_dashboard_bundle(self, campaign_id: str) -> DashboardBundle:
+        """Fetch status, candidates, and report concurrently over the shared session."""
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="dashboard") as pool:
+            status = pool.submit(self.get_campaign_status, campaign_id)
+            candidates = pool.submit(self.get_campaign_candidates, campaign_id)
+            report = pool.submit(self.get_campaign_report, campaign_id)
+            return DashboardBundle(
+                status=status.result(),
+                candidates=candidates.result(),
+                report=report.result(),
+            )
+
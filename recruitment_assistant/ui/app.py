@@ -1,6 +1,7 @@
 import streamlit as st
-from recruitment_assistant.ui.api_client import APIClient
+from recruitment_assistant.ui.api_client import APIClient, DashboardBundle
 from recruitment_assistant.ui.components import (
+    fetch_report_candidates,
     render_sidebar,
     render_jd_section,
     render_candidates_section,
@@ -8,17 +9,33 @@ from recruitment_assistant.ui.components import (
 )
 
 API_BASE_URL: str = "http://localhost:8000"
+CAMPAIGN_ID: str = "CAMP_001"
 
 st.set_page_config(page_title="Recruitment Assistant AI", layout="wide")
 
+
+@st.cache_resource
+def get_api_client(base_url: str) -> APIClient:
+    """Keep one client (and its HTTP session) alive across script reruns."""
+    return APIClient(base_url)
+
+
+@st.cache_data(ttl=5)
+def fetch_dashboard(_api_client: APIClient, campaign_id: str) -> DashboardBundle:
+    """Fetch the dashboard panels in one concurrent round, deduplicated across quick reruns."""
+    return _api_client.fetch_dashboard_bundle(campaign_id)
+
+
 def main() -> None:
-    api_client = APIClient(API_BASE_URL)
-    render_sidebar(api_client)
+    api_client = get_api_client(API_BASE_URL)
+    bundle = fetch_dashboard(api_client, CAMPAIGN_ID)
+    render_sidebar(api_client, bundle.status)
 
     st.title("JD Dashboard & Campaign Manager")
     render_jd_section(api_client)
-    candidates = render_candidates_section(api_client)
-    render_final_report(api_client, candidates)
+    render_candidates_section(api_client, bundle.candidates)
+    # The report covers every candidate, not just the page shown in the review grid.
+    render_final_report(api_client, fetch_report_candidates(api_client, CAMPAIGN_ID), bundle.report)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,45 @@
 """Streamlit UI components for the Recruitment Assistant dashboard."""
 
+from datetime import datetime
+
 import pandas as pd
 import streamlit as st
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from recruitment_assistant.ui.api_client import CANDIDATE_PAGE_SIZE, APIClient, APIResponse
+from recruitment_assistant.ui.report_utils import REPORT_DATE_FORMAT, generate_pdf_report
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_report_pdf(report: Dict[str, Any], candidates: List[Dict[str, Any]], report_date: str) -> bytes:
+    """Render the PDF once per distinct payload and day; the date keeps the footer current."""
+    return generate_pdf_report(report, candidates, report_date)
+
+
+def build_report_pdf(report: Dict[str, Any], candidates: List[Dict[str, Any]]) -> bytes:
+    """Reuse the rendered PDF across reruns until the payload or the day changes."""
+    return _cached_report_pdf(report, candidates, datetime.now().strftime(REPORT_DATE_FORMAT))
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def fetch_candidates_page(
+    _api_client: APIClient, campaign_id: str, limit: int, offset: int
+) -> APIResponse:
+    """Fetch one candidate page; each (campaign_id, limit, offset) slice is cached separately."""
+    return _api_client.get_campaign_candidates(campaign_id, limit=limit, offset=offset)
 
-from recruitment_assistant.ui.api_client import APIClient
-from recruitment_assistant.ui.report_utils import generate_pdf_report
 
+@st.cache_data(ttl=10, show_spinner=False)
+def fetch_report_candidates(_api_client: APIClient, campaign_id: str) -> List[Dict[str, Any]]:
+    """Fetch the full candidate slate for the PDF; the review grid only ever holds one page."""
+    resp = _api_client.get_campaign_candidates(campaign_id, limit=None)
+    return (resp.data or []) if resp.success else []
 
-def render_sidebar(api_client: APIClient) -> None:
+
+CANDIDATE_READONLY_COLUMNS = ("name", "role", "score", "tags")
+
+
+def render_sidebar(api_client: APIClient, status_resp: Optional[APIResponse] = None) -> None:
     """Render the collapsible sidebar with campaign status info."""
     with st.sidebar:
         if "exit_requested" not in st.session_state:
@@ -22,7 +53,7 @@ def render_sidebar(api_client: APIClient) -> None:
         st.title("Recruitment AI")
         st.markdown("---")
 
-        status_resp = api_client.get_campaign_status("CAMP_001")
+        status_resp = status_resp or api_client.get_campaign_status("CAMP_001")
         if not status_resp.success:
             st.warning(status_resp.error or "Backend API not available.")
             return
@@ -54,6 +85,7 @@ def render_jd_section(api_client: APIClient) -> None:
                 payload = {"title": jd_title, "content": jd_text}
                 res = api_client.create_campaign(payload)
                 if res.success:
+                    st.cache_data.clear()
                     st.success(f"Campaign initialized for {jd_title}!")
                 else:
                     st.error(res.error or "Failed to initialize campaign.")
@@ -61,10 +93,42 @@ def render_jd_section(api_client: APIClient) -> None:
                 st.error("Please provide a Title and JD content.")
 
 
-def render_candidates_section(api_client: APIClient) -> List[Dict[str, Any]]:
+def _candidate_frame(candidates: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Flatten a candidate page into the editable review grid, indexed by candidate id."""
+    return pd.DataFrame.from_records(
+        [
+            {
+                "candidate_id": cand.get("candidate_id") or cand.get("id", ""),
+                "name": cand.get("name", "Candidate"),
+                "role": cand.get("role", "Unknown"),
+                "score": cand.get("score"),
+                "tags": ", ".join(cand.get("tags", [])),
+                "outreach_draft": cand.get("outreach_draft", ""),
+                "approve": False,
+            }
+            for cand in candidates
+        ],
+        index="candidate_id",
+    )
+
+
+def render_candidates_section(
+    api_client: APIClient,
+    candidates_resp: Optional[APIResponse] = None,
+) -> List[Dict[str, Any]]:
     """List candidate reviews and provide outreach approval controls."""
     st.subheader("🕵️ Selected Candidate Review")
-    candidates_resp = api_client.get_campaign_candidates("CAMP_001")
+    page_col, size_col = st.columns(2)
+    page = int(page_col.number_input("Page", min_value=1, value=1, step=1))
+    page_size = int(
+        size_col.number_input(
+            "Candidates per page", min_value=5, max_value=100, value=CANDIDATE_PAGE_SIZE, step=5
+        )
+    )
+    offset = (page - 1) * page_size
+    # The pre-fetched dashboard bundle only covers the default first page.
+    if candidates_resp is None or offset or page_size != CANDIDATE_PAGE_SIZE:
+        candidates_resp = fetch_candidates_page(api_client, "CAMP_001", page_size, offset)
     if not candidates_resp.success:
         st.error(candidates_resp.error or "Unable to load candidates.")
         return []
@@ -74,75 +138,103 @@ def render_candidates_section(api_client: APIClient) -> List[Dict[str, Any]]:
         st.info("Start a campaign or ensure the API is running to view candidate results.")
         return []
 
-    for cand in candidates:
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"### {cand.get('name', 'Candidate')}")
-            st.markdown(f"**Role**: {cand.get('role', 'Unknown')}")
-            tags = cand.get("tags", [])
-            st.markdown(f"**Tags**: {' '.join([f'`{t}`' for t in tags])}")
-            with st.expander("🔍 View Agent Rationale (HITL Transparency)"):
-                st.write(cand.get("rationale", "No rationale provided."))
-
-        with col2:
-            st.markdown("### Outreach Draft Review")
-            outreach_draft = st.text_area(
-                f"Draft for {cand.get('name','Candidate')}",
-                value=cand.get("outreach_draft", ""),
-                height=150,
-                key=f"outreach_{cand.get('id', 'candidate')}",
-            )
-            if st.button(f"Approve & Send to {cand.get('name','Candidate')}", key=f"btn_{cand.get('id','candidate')}"):
-                payload = {
-                    "campaign_id": "CAMP_001",
-                    "candidate_id": cand.get("id", ""),
-                    "message": outreach_draft or cand.get("outreach_draft", ""),
-                }
-                send_resp = api_client.send_outreach(payload)
-                if send_resp.success:
-                    st.success(f"Outreach queued for {cand.get('name','Candidate')}!")
-                else:
-                    st.error(send_resp.error or "Outreach queueing failed.")
+    # One data_editor widget replaces the per-row columns/text_area/checkbox tree.
+    editor_key = f"candidate_editor_{offset}_{page_size}"
+    edited = st.data_editor(
+        _candidate_frame(candidates),
+        column_config={
+            "score": st.column_config.ProgressColumn("Score", min_value=0.0, max_value=1.0),
+            "outreach_draft": st.column_config.TextColumn("Outreach Draft", width="large"),
+            "approve": st.column_config.CheckboxColumn("Approve"),
+        },
+        disabled=CANDIDATE_READONLY_COLUMNS,
+        hide_index=True,
+        key=editor_key,
+    )
+
+    # Approvals survive reruns and page changes until the batch is sent.
+    pending: Dict[str, Dict[str, Any]] = st.session_state.setdefault("pending_outreach", {})
+    for candidate_id, row in edited.iterrows():
+        # A cleared TextColumn cell comes back as None, not "".
+        if row["approve"] and (row["outreach_draft"] or "").strip():
+            pending[candidate_id] = {
+                "campaign_id": "CAMP_001",
+                "candidate_id": candidate_id,
+                "message": row["outreach_draft"],
+            }
+        else:
+            pending.pop(candidate_id, None)
+
+    drill_down = st.multiselect(
+        "🔍 View Agent Rationale (HITL Transparency)",
+        options=[cand.get("name", "Candidate") for cand in candidates],
+    )
+    if drill_down:
+        selected = set(drill_down)
+        for cand in candidates:
+            if cand.get("name", "Candidate") in selected:
+                with st.expander(cand.get("name", "Candidate"), expanded=True):
+                    st.write(cand.get("rationale", "No rationale provided."))
+
+    if pending and st.button(f"Send {len(pending)} approved", key="btn_send_batch"):
+        send_resp = api_client.send_outreach_batch(list(pending.values()))
+        if send_resp.success:
+            st.cache_data.clear()
+            st.session_state.pop(editor_key, None)
+            st.success(f"Outreach queued for {len(pending)} candidates!")
+            pending.clear()
+        else:
+            st.error(send_resp.error or "Outreach queueing failed.")
     return candidates
 
 
-def render_final_report(api_client: APIClient, candidates: Optional[List[Dict[str, Any]]]) -> None:
-    """Show the final report metrics, recommendation, and download action."""
-    st.markdown("---")
-    st.subheader("📑 Final Recruitment Session Report")
-    report_resp = api_client.get_campaign_report("CAMP_001")
+def render_final_report(
+    api_client: APIClient,
+    candidates: Optional[List[Dict[str, Any]]],
+    report_resp: Optional[APIResponse] = None,
+    *,
+    st_module: Any = st,
+    pdf_generator: Callable[[Dict[str, Any], List[Dict[str, Any]]], bytes] = build_report_pdf,
+) -> None:
+    """Show the final report metrics, recommendation, and download action.
+
+    ``st_module`` and ``pdf_generator`` are injectable so tests can render without patching globals.
+    """
+    st_module.markdown("---")
+    st_module.subheader("📑 Final Recruitment Session Report")
+    report_resp = report_resp or api_client.get_campaign_report("CAMP_001")
     if not report_resp.success:
-        st.info(report_resp.error or "Session report will be ready soon.")
+        st_module.info(report_resp.error or "Session report will be ready soon.")
         return
 
     report = report_resp.data or {}
     summ = report.get("session_summary", {})
     perf = report.get("performance_metrics", {})
 
-    with st.container():
-        col1, col2, col3, col4 = st.columns(4)
+    with st_module.container():
+        col1, col2, col3, col4 = st_module.columns(4)
         col1.metric("Candidates Sourced", summ.get("total_candidates_sourced", 0))
         col2.metric("High Quality Matches", summ.get("high_quality_matches", 0))
         col3.metric("Manual Reviews", summ.get("manual_review_items", 0))
         col4.metric("Ethical Audit Status", summ.get("ethical_audit", {}).get("status", "pending"))
-        st.markdown("#### Execution Performance")
-        pcol1, pcol2, pcol3 = st.columns(3)
+        st_module.markdown("#### Execution Performance")
+        pcol1, pcol2, pcol3 = st_module.columns(3)
         pcol1.write(f"**Total Runtime**: {perf.get('total_execution_time', 'N/A')}")
         pcol2.write(f"**Avg Agent Latency**: {perf.get('avg_latency_per_agent', 'N/A')}")
         pcol3.write(f"**Estimated Cost (Tokens)**: {perf.get('estimated_token_cost', 'N/A')}")
-        st.markdown("#### Strategic Recommendation")
-        st.success(report.get("recommendation", "Recommendation pending."))
+        st_module.markdown("#### Strategic Recommendation")
+        st_module.success(report.get("recommendation", "Recommendation pending."))
 
-        pdf_bytes = generate_pdf_report(report, candidates or [])
+        pdf_bytes = pdf_generator(report, candidates or [])
         if not pdf_bytes:
-            st.warning("Couldn\'t generate the PDF report right now; please try again shortly.")
+            st_module.warning("Couldn\'t generate the PDF report right now; please try again shortly.")
         else:
-            st.download_button(
+            st_module.download_button(
                 label="📄 Download Recruitment Report (PDF)",
                 data=pdf_bytes,
                 file_name=f"recruitment_session_{report.get('campaign_id','campaign')}.pdf",
                 mime="application/pdf",
             )
 
-        with st.expander("Detailed Audit & Ethics Logs (GDPR Requirement)"):
-            st.json(report)
\ No newline at end of file
+        with st_module.expander("Detailed Audit & Ethics Logs (GDPR Requirement)"):
+            st_module.json(report)
\ No newline at end of file
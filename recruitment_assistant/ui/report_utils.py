@@ -1,21 +1,89 @@
 """PDF report helpers consumed by the Streamlit UI."""
 
 from datetime import datetime
-from fpdf import FPDF
-from fpdf.enums import XPos, YPos
-from typing import Any, Dict, List, Optional
 
-
-def generate_pdf_report(report_data: Dict[str, Any], candidates: Optional[List[Dict[str, Any]]] = None) -> bytes:
-    """Build a formatted recruitment PDF report from the session payload.
+import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
+# Core PDF font; fpdf2 maps "Arial" onto it with a warning on every set_font call.
+FONT_FAMILY = "Helvetica"
+TABLE_HEADINGS = ("Name", "Current Role", "Score", "Portfolio/URL", "Flags")
+TABLE_COL_WIDTHS = (50, 60, 20, 100, 40)
+TABLE_CELL_ALIGN = ("L", "L", "C", "L", "L")
+TABLE_ROW_HEIGHT = 10
+HEADING_FILL = (241, 245, 249)
+TOP_ROW_FILL = (200, 255, 200)
+DECLINED_ROW_FILL = (255, 230, 230)
+DEFAULT_ROW_FILL = (255, 255, 255)
+REPORT_DATE_FORMAT = "%B %d, %Y"
+
+
+def _table_row(pdf: "FPDF", columns: Tuple[Tuple[int, str], ...], texts: Tuple[str, ...]) -> None:
+    """Emit one fixed-height table row with plain cell() calls, then move to the next line."""
+    for (width, align), text in zip(columns, texts):
+        pdf.cell(w=width, h=TABLE_ROW_HEIGHT, text=text, border=1, align=align, fill=True)
+    pdf.ln(TABLE_ROW_HEIGHT)
+
+
+def _candidate_rows(candidates: List[Dict[str, Any]]) -> Tuple[List[Tuple[str, ...]], List[bool]]:
+    """Pre-format every table row column-wise so the render loop only emits ready strings."""
+    count = len(candidates)
+    scores = np.fromiter(
+        (
+            cand.get("final_score", 0) if cand.get("score") is None else cand["score"]
+            for cand in candidates
+        ),
+        dtype=np.float64,
+        count=count,
+    )
+    # A missing score never marks a row as declined, even when final_score is low.
+    raw_scores = np.fromiter((cand.get("score", 1) for cand in candidates), dtype=np.float64, count=count)
+    is_declined: List[bool] = (raw_scores < 0.5).tolist()
+    score_texts = [f"{score * 100:.0f}%" for score in scores.tolist()]
+    # One substring test on the joined tags instead of a per-tag any() generator;
+    # NUL can't occur in a tag, so adjacent tags never combine into a match.
+    flag_texts = [
+        "Data Deficient" if "Data Deficient" in "\x00".join(cand.get("tags", [])) else "-"
+        for cand in candidates
+    ]
+    rows: List[Tuple[str, ...]] = [
+        (
+            str(cand.get("name", "-")),
+            str(cand.get("role", "-")),
+            score_text,
+            str(cand.get("profile_url") or cand.get("url") or "-"),
+            flag_text,
+        )
+        for cand, score_text, flag_text in zip(candidates, score_texts, flag_texts)
+    ]
+    return rows, is_declined
+
+
+def generate_pdf_report(
+    report_data: Dict[str, Any],
+    candidates: Optional[List[Dict[str, Any]]] = None,
+    report_date: Optional[str] = None,
+) -> bytes:
+    """Build a formatted recruitment PDF report.
 
     Args:
         report_data: Full report payload returned by the API.
         candidates: Optional list of selected candidate summaries.
+        report_date: Footer date; defaults to today.
 
     Returns:
         The generated report as bytes, or an empty bytestring when creation failed.
     """
+    candidates = candidates or []
+    report_date = report_date or datetime.now().strftime(REPORT_DATE_FORMAT)
+
+    # fpdf is only needed once a report is actually rendered, so keep it off UI startup.
+    from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+
     pdf = FPDF(orientation="L")
     pdf.add_page()
 
@@ -23,17 +91,17 @@ def generate_pdf_report(report_data: Dict[str, Any], candidates: Optional[List[D
     pdf.set_fill_color(30, 41, 59)
     pdf.rect(0, 0, 297, 40, "F")
     pdf.set_text_color(255, 255, 255)
-    pdf.set_font("Arial", "B", 22)
+    pdf.set_font(FONT_FAMILY, "B", 22)
     pdf.cell(w=0, h=20, text="JD Recruiting Assistance Report", border=0, align="C", new_x=XPos.LEFT, new_y=YPos.NEXT)
 
-    pdf.set_font("Arial", "B", 14)
+    pdf.set_font(FONT_FAMILY, "B", 14)
     jd_title = report_data.get("campaign_id", "CAMP_001")
     jd_name = report_data.get("job_title", "Recruitment Campaign")
     pdf.cell(w=0, h=10, text=f"{jd_name} | JD #{jd_title}", border=0, align="C", new_x=XPos.LEFT, new_y=YPos.NEXT)
     pdf.ln(10)
 
     pdf.set_text_color(0, 0, 0)
-    pdf.set_font("Arial", "B", 14)
+    pdf.set_font(FONT_FAMILY, "B", 14)
     pdf.set_draw_color(30, 41, 59)
     pdf.cell(w=0, h=10, text="1. Session Insights", border=0, align="L", new_x=XPos.LEFT, new_y=YPos.NEXT)
     pdf.line(10, pdf.get_y(), 60, pdf.get_y())
@@ -42,7 +110,7 @@ def generate_pdf_report(report_data: Dict[str, Any], candidates: Optional[List[D
     session_summary = report_data.get("session_summary", {})
     performance_metrics = report_data.get("performance_metrics", {})
 
-    pdf.set_font("Arial", "", 11)
+    pdf.set_font(FONT_FAMILY, "", 11)
     pdf.cell(
         w=0,
         h=8,
@@ -71,96 +139,44 @@ def generate_pdf_report(report_data: Dict[str, Any], candidates: Optional[List[D
     pdf.ln(10)
 
     if candidates:
-        pdf.set_font("Arial", "B", 14)
+        pdf.set_font(FONT_FAMILY, "B", 14)
         pdf.cell(w=0, h=10, text="2. Qualitative Breakdown", border=0, align="L", new_x=XPos.LEFT, new_y=YPos.NEXT)
         pdf.line(10, pdf.get_y(), 60, pdf.get_y())
         pdf.ln(5)
 
-        pdf.set_fill_color(241, 245, 249)
-        pdf.set_font("Arial", "B", 10)
-        pdf.cell(w=50, h=10, text="Name", border=1, align="L", fill=True)
-        pdf.cell(w=60, h=10, text="Current Role", border=1, align="L", fill=True)
-        pdf.cell(w=20, h=10, text="Score", border=1, align="C", fill=True)
-        pdf.cell(w=100, h=10, text="Portfolio/URL", border=1, align="L", fill=True)
-        pdf.cell(w=40, h=10, text="Flags", border=1, align="L", fill=True, new_x=XPos.LEFT, new_y=YPos.NEXT)
+        rows, is_declined = _candidate_rows(candidates)
+        row_fills = [
+            DECLINED_ROW_FILL if declined else TOP_ROW_FILL if i < 3 else DEFAULT_ROW_FILL
+            for i, declined in enumerate(is_declined)
+        ]
+        columns = tuple(zip(TABLE_COL_WIDTHS, TABLE_CELL_ALIGN))
+
+        pdf.set_fill_color(*HEADING_FILL)
+        pdf.set_font(FONT_FAMILY, "B", 10)
+        _table_row(pdf, columns, TABLE_HEADINGS)
 
-        pdf.set_font("Arial", "", 9)
-        for i, cand in enumerate(candidates):
+        pdf.set_font(FONT_FAMILY, "", 9)
+        pdf.set_draw_color(0, 0, 0)
+        for row, fill, declined in zip(rows, row_fills, is_declined):
             current_y = pdf.get_y()
-            is_declined = cand.get("score", 1) < 0.5
-            if i < 3 and not is_declined:
-                pdf.set_fill_color(200, 255, 200)
-            elif is_declined:
-                pdf.set_fill_color(255, 230, 230)
-            else:
-                pdf.set_fill_color(255, 255, 255)
-
-            flag_text = "Data Deficient" if any("Data Deficient" in tag for tag in cand.get("tags", [])) else "-"
-
-            candidate_score = cand.get("score")
-            if candidate_score is None:
-                candidate_score = cand.get("final_score", 0)
-            profile_link = cand.get("profile_url") or cand.get("url") or "-"
-            pdf.cell(
-                w=50,
-                h=10,
-                text=str(cand.get("name", "-")),
-                border=1,
-                align="L",
-                fill=True,
-            )
-            pdf.cell(
-                w=60,
-                h=10,
-                text=str(cand.get("role", "-")),
-                border=1,
-                align="L",
-                fill=True,
-            )
-            pdf.cell(
-                w=20,
-                h=10,
-                text=f"{candidate_score * 100:.0f}%",
-                border=1,
-                align="C",
-                fill=True,
-            )
-            pdf.cell(
-                w=100,
-                h=10,
-                text=str(profile_link),
-                border=1,
-                align="L",
-                fill=True,
-            )
-            pdf.cell(
-                w=40,
-                h=10,
-                text=flag_text,
-                border=1,
-                align="L",
-                fill=True,
-                new_x=XPos.LEFT,
-                new_y=YPos.NEXT,
-            )
-
-            if is_declined:
+            pdf.set_fill_color(*fill)
+            _table_row(pdf, columns, row)
+            if declined:
                 pdf.set_draw_color(185, 28, 28)
                 pdf.line(10, current_y + 5, 280, current_y + 5)
                 pdf.set_draw_color(0, 0, 0)
         pdf.ln(5)
 
-    pdf.set_font("Arial", "B", 14)
+    pdf.set_font(FONT_FAMILY, "B", 14)
     pdf.cell(w=0, h=10, text="3. Final Recommendation", border=0, align="L", new_x=XPos.LEFT, new_y=YPos.NEXT)
     pdf.line(10, pdf.get_y(), 60, pdf.get_y())
-    pdf.set_font("Arial", "I", 11)
+    pdf.set_font(FONT_FAMILY, "I", 11)
     pdf.ln(2)
     pdf.multi_cell(0, 8, report_data.get("recommendation", "No recommendation available."))
 
     pdf.set_y(-25)
-    pdf.set_font("Arial", "I", 8)
+    pdf.set_font(FONT_FAMILY, "I", 8)
     pdf.set_text_color(100, 100, 100)
-    report_date = datetime.now().strftime("%B %d, %Y")
     pdf.cell(0, 10, f"Analysis Date: {report_date} | Generated by Recruitment Assistant AI", align="C")
 
     output_data = pdf.output()
@@ -3,31 +3,26 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 
-def find_repo_root() -> Path:
-    """Locate the repository root for running uv-managed commands."""
-    current = Path(__file__).resolve()
-    git_root: Path | None = None
-    for parent in current.parents:
-        if (parent / "pyproject.toml").exists():
-            return parent
-        if git_root is None and (parent / ".git").exists():
-            git_root = parent
-    if git_root is not None:
-        return git_root
-    return current.parents[1]
-
-
-ROOT = find_repo_root()
+# This file always lives at <repo>/scripts/cli.py, so the root is known without a walk.
+ROOT = Path(__file__).resolve().parents[1]
 
 
 def run_command(command: list[str]) -> int:
-    """Execute the provided command within the repo root."""
-    return subprocess.run(command, cwd=ROOT).returncode
+    """Execute the provided command within the repo root.
+
+    On POSIX the CLI process is replaced via ``execvp`` so no idle parent lingers;
+    Windows lacks true exec semantics, so it falls back to waiting on a child.
+    """
+    if os.name == "nt":
+        return subprocess.run(command, cwd=ROOT).returncode
+    os.chdir(ROOT)
+    os.execvp(command[0], command)
 
 
 def main() -> None:
@@ -50,6 +45,16 @@ def main() -> None:
         action="store_true",
         help="Pass --reload to uvicorn when running the API server.",
     )
+    parser.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Run the test suite in a single process (no pytest-xdist workers).",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Run every test instead of last-failed/failed-first ordering.",
+    )
     parser.add_argument(
         "--extra",
         nargs=argparse.REMAINDER,
@@ -92,6 +97,11 @@ def main() -> None:
         ]
     else:  # args.target == "test"
         command = ["uv", "run", "pytest"]
+        if not args.no_parallel:
+            # loadfile keeps each module on one worker so its scoped fixtures build once.
+            command.extend(["-n", "auto", "--dist", "loadfile"])
+        if not args.all:
+            command.extend(["--lf", "--ff"])
 
     command.extend(extra)
     code = run_command(command)
@@ -1,8 +1,25 @@
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
 
 # Add the MVP root to sys.path using pathlib
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
-    
\ No newline at end of file
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator["TestClient"]:
+    """One TestClient (and one lifespan startup) shared by every API test."""
+    # Imported here so UI-only runs and workers never load FastAPI, crewai or the store.
+    from fastapi.testclient import TestClient
+
+    from recruitment_assistant.api.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from recruitment_assistant.agents.crew import (
@@ -16,45 +18,69 @@ from recruitment_assistant.agents.crew import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def job_description() -> JobDescriptionModel:
     return JobDescriptionModel(title="Senior Python Engineer", content="Build scalable APIs")
 
 
-def test_researcher_agent_returns_candidate_seeds(job_description: JobDescriptionModel) -> None:
-    researcher = ResearcherAgent()
-    seeds = researcher.research(job_description)
+@pytest.fixture(scope="module")
+def seeds(job_description: JobDescriptionModel) -> list[CandidateSeed]:
+    return ResearcherAgent().research(job_description)
+
+
+@pytest.fixture(scope="module")
+def evaluations(seeds: list[CandidateSeed]) -> list[EvaluationResult]:
+    return EvaluatorAgent().evaluate(seeds)
+
+
+def test_researcher_agent_returns_candidate_seeds(seeds: list[CandidateSeed]) -> None:
     assert seeds and all(isinstance(seed, CandidateSeed) for seed in seeds)
     assert any("Data Deficient" in seed.tags for seed in seeds)
 
 
-def test_evaluator_agent_scores_candidates(job_description: JobDescriptionModel) -> None:
-    researcher = ResearcherAgent()
-    evaluator = EvaluatorAgent()
+def test_researcher_agent_accepts_mapping_candidate_pool(job_description: JobDescriptionModel) -> None:
+    pool = [
+        {
+            "name": "Ada Graph",
+            "role": "Data Engineer",
+            "score": 0.7,
+            "tags": ["High Confidence"],
+            "data_sources": ["GitHub"],
+            "profile_url": "https://talent.example.com/ada-graph",
+        }
+    ]
+    researcher = ResearcherAgent(candidate_pool=pool)
     seeds = researcher.research(job_description)
-    evaluations = evaluator.evaluate(seeds)
+    assert [seed.name for seed in seeds] == ["Ada Graph"]
+    assert list(seeds[0].tags) == ["High Confidence"]
+    assert seeds[0].profile_url == "https://talent.example.com/ada-graph"
+
+
+def test_evaluator_agent_scores_candidates(evaluations: list[EvaluationResult]) -> None:
     assert evaluations and all(isinstance(result, EvaluationResult) for result in evaluations)
     assert all(0.0 <= result.score <= 1.0 for result in evaluations)
 
 
-def test_recommender_agent_rankings_respect_policy(job_description: JobDescriptionModel) -> None:
-    researcher = ResearcherAgent()
-    evaluator = EvaluatorAgent()
+def test_evaluator_agent_parallel_matches_serial(
+    seeds: list[CandidateSeed], evaluations: list[EvaluationResult]
+) -> None:
+    serial = evaluations
+    parallel = EvaluatorAgent(parallel=True, max_workers=2).evaluate(seeds)
+    assert [(r.candidate_id, r.score, r.bias_flags) for r in parallel] == [
+        (r.candidate_id, r.score, r.bias_flags) for r in serial
+    ]
+
+
+def test_recommender_agent_rankings_respect_policy(evaluations: list[EvaluationResult]) -> None:
     recommender = RecommenderAgent()
-    seeds = researcher.research(job_description)
-    evaluations = evaluator.evaluate(seeds)
     ranked = recommender.recommend(evaluations, RankingPolicy(name="balanced"))
     assert ranked and all(isinstance(candidate, RankedCandidate) for candidate in ranked)
     assert ranked[0].final_score >= ranked[-1].final_score
 
 
-def test_writer_agent_creates_outreach(job_description: JobDescriptionModel) -> None:
-    researcher = ResearcherAgent()
+def test_writer_agent_creates_outreach(evaluations: list[EvaluationResult]) -> None:
     recommender = RecommenderAgent()
-    evaluator = EvaluatorAgent()
     writer = WriterAgent()
-    seeds = researcher.research(job_description)
-    evaluations = evaluator.evaluate(seeds)
     ranked = recommender.recommend(evaluations, RankingPolicy())
     draft = writer.draft("CAMP_001", ranked[0], OutreachTemplate())
     assert isinstance(draft, OutreachDraft)
@@ -70,6 +96,35 @@ def test_recruitment_crew_run_campaign_and_risk(job_description: JobDescriptionM
     assert risk_assessment.level in {"standard", "elevated"}
 
 
+def test_recruitment_crew_memoizes_campaign_and_rerank(job_description: JobDescriptionModel) -> None:
+    crew = RecruitmentCrew(jd_data=job_description)
+    ranked, evaluations = crew.run_campaign(job_description)
+    again_ranked, again_evaluations = crew.run_campaign(job_description)
+    assert again_ranked == ranked and again_evaluations == evaluations
+    assert again_ranked[0] is ranked[0]
+    reranked = crew.rerank(evaluations, RankingPolicy(name="diverse"))
+    assert crew.rerank(evaluations, RankingPolicy(name="diverse"))[0] is reranked[0]
+    assert crew.rerank(list(evaluations), RankingPolicy(name="diverse"))[0] is not reranked[0]
+
+
+def test_recruitment_crew_run_campaign_async_matches_sync(job_description: JobDescriptionModel) -> None:
+    crew = RecruitmentCrew(jd_data=job_description)
+    ranked, evaluations = crew.run_campaign(job_description)
+    async_ranked, async_evaluations = asyncio.run(crew.run_campaign_async(job_description))
+    assert [c.candidate_id for c in async_ranked] == [c.candidate_id for c in ranked]
+    assert [e.candidate_id for e in async_evaluations] == [e.candidate_id for e in evaluations]
+    assert crew.latest_candidates == async_ranked
+
+
+def test_recruitment_crew_outreach_async_matches_batch(job_description: JobDescriptionModel) -> None:
+    crew = RecruitmentCrew(jd_data=job_description)
+    ranked, _ = crew.run_campaign(job_description)
+    drafts = crew.generate_outreach("CAMP_BATCH", ranked)
+    async_drafts = asyncio.run(crew.generate_outreach_async("CAMP_BATCH", ranked))
+    assert [d.candidate_id for d in async_drafts] == [c.candidate_id for c in ranked]
+    assert [d.message for d in async_drafts] == [d.message for d in drafts]
+
+
 def test_recruitment_crew_outreach_and_compliance(job_description: JobDescriptionModel) -> None:
     crew = RecruitmentCrew(jd_data=job_description)
     ranked, _ = crew.run_campaign(job_description)
@@ -1,14 +1,11 @@
 from fastapi.testclient import TestClient
-from recruitment_assistant.api.main import app
 
-client = TestClient(app)
-
-def test_read_root():
+def test_read_root(client: TestClient):
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Recruitment Assistant AI API is live."}
 
-def test_health_check():
+def test_health_check(client: TestClient):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
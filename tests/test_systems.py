@@ -9,53 +9,63 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from recruitment_assistant.api.main import app, JobDescription
 from recruitment_assistant.agents.crew import RecruitmentCrew
 
 
-client = TestClient(app)
-
 # Mock JD Data
 mock_jd: Dict[str, Any] = {
     "title": "Senior Data Engineer",
     "content": "Expert in PySpark, Kubernetes and Azure Data Factory."
 }
 
-def test_campaign_creation_standard() -> None:
+@pytest.fixture(scope="module")
+def crew() -> RecruitmentCrew:
+    """Build the crew (and its agent/model setup) once for this module."""
+    return RecruitmentCrew(mock_jd)
+
+def test_campaign_creation_standard(client: TestClient) -> None:
     """Tests standard campaign creation."""
     response = client.post("/campaign/create", json=mock_jd)
     assert response.status_code == 200
     assert response.json()["status"] == "initialized"    
 
-def test_campaign_creation_invalid_title() -> None:
+def test_campaign_creation_persists_in_background(client: TestClient) -> None:
+    """Reserved campaign ids resolve once the background persistence has run."""
+    response = client.post("/campaigns", json=mock_jd)
+    assert response.status_code == 200
+    campaign_id = response.json()["campaign_id"]
+    status = client.get(f"/campaigns/{campaign_id}/status")
+    assert status.status_code == 200
+    assert status.json()["status"] == "initialized"
+
+def test_campaign_creation_invalid_title(client: TestClient) -> None:
     """Tests edge case: Input Sanitization (SAD Section 6)."""
     invalid_jd = {"title": "SE", "content": "Too short"}
     response = client.post("/campaign/create", json=invalid_jd)
     assert response.status_code == 400
     assert "Invalid JD Title" in response.json()["detail"]
 
-def test_agent_initialization_typing() -> None:
+def test_agent_initialization_typing(crew: RecruitmentCrew) -> None:
     """Tests if RecruitmentCrew initializes with correct typing."""
-    crew = RecruitmentCrew(mock_jd)
     assert isinstance(crew.jd_data, dict)
     assert crew.eval_model == "gpt-4o"
     assert crew.sourcer_model == "gpt-4o-mini"
 
-def test_campaign_status_polling() -> None:
+def test_campaign_status_polling(client: TestClient) -> None:
     """SAD requires async status polling."""
     response = client.get("/campaigns/CAMP_001/status")
     assert response.status_code == 200
     assert response.json()["campaign_id"] == "CAMP_001"
     assert response.json()["status"] in {"created", "running", "completed"}
 
-def test_health_check_payload() -> None:
+def test_health_check_payload(client: TestClient) -> None:
     """Tests the production-grade health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
     assert "version" in response.json()
 
-def test_campaign_report_structure() -> None:
+def test_campaign_report_structure(client: TestClient) -> None:
     """Tests the reporting endpoint structure (SAD Section 8/9)."""
     response = client.get("/campaign/CAMP_001/report")
     assert response.status_code == 200
@@ -67,14 +77,45 @@ def test_campaign_report_structure() -> None:
     assert metrics["total_candidates"] >= 0
     assert "selection_rationale" in metrics
 
-def test_recruitment_advisor_integration() -> None:
+def test_campaign_report_honours_if_none_match(client: TestClient) -> None:
+    """Tests that an unchanged report is revalidated with 304 Not Modified."""
+    first = client.get("/campaigns/CAMP_001/report")
+    etag = first.headers["ETag"]
+    revalidated = client.get("/campaigns/CAMP_001/report", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+
+def test_campaign_candidates_paginates_and_projects_fields(client: TestClient) -> None:
+    """Tests that a candidate page honours limit/offset and the requested fields."""
+    full = client.get("/campaigns/CAMP_001/candidates").json()
+    response = client.get(
+        "/campaigns/CAMP_001/candidates", params={"limit": 1, "offset": 1, "fields": "candidate_id,name"}
+    )
+    assert response.status_code == 200
+    assert response.json() == [{key: full[1][key] for key in ("candidate_id", "name")}]
+
+def test_outreach_batch_records_one_audit_entry_per_message(client: TestClient) -> None:
+    """Tests that a batch send queues every message in one request."""
+    messages = [
+        {"campaign_id": "CAMP_001", "candidate_id": f"batch_{idx}", "message": "Hello"} for idx in range(3)
+    ]
+    response = client.post("/outreach/send/batch", json={"messages": messages})
+    assert response.status_code == 200
+    assert response.json()["candidate_ids"] == ["batch_0", "batch_1", "batch_2"]
+    sent = [
+        entry["details"]["candidate_id"]
+        for entry in client.get("/audit-logs").json()
+        if entry["action"] == "outreach_sent"
+    ]
+    assert sent[-3:] == ["batch_0", "batch_1", "batch_2"]
+
+def test_recruitment_advisor_integration(crew: RecruitmentCrew) -> None:
     """Tests if the Recruitment Advisor agent is present in the Crew."""
-    crew = RecruitmentCrew(mock_jd)
     advisor = crew.recruitment_advisor()
     assert advisor.role == 'Recruitment Advisor'
     assert "Ranking" in advisor.goal or "Rank" in advisor.goal
 
-def test_candidate_ranking_payload() -> None:
+def test_candidate_ranking_payload(client: TestClient) -> None:
     """Tests ranking endpoint returns rationales and scores."""
     rank_payload = {"filters": ["diversity"], "limit": 3}
     response = client.post("/campaigns/CAMP_001/rank", json=rank_payload)
@@ -84,7 +125,7 @@ def test_candidate_ranking_payload() -> None:
     assert ranked[0]["score"] >= 0 and ranked[0]["score"] <= 1
     assert "rationale" in ranked[0]
 
-def test_outreach_drafts_and_send() -> None:
+def test_outreach_drafts_and_send(client: TestClient) -> None:
     """Tests outreach draft creation and send queue."""
     response = client.post("/campaigns/CAMP_001/outreach")
     assert response.status_code == 200
@@ -97,7 +138,7 @@ def test_outreach_drafts_and_send() -> None:
     assert send_resp.status_code == 200
     assert send_resp.json()["status"] in {"queued", "sent"}
 
-def test_candidate_ranking_and_human_flagging_logic() -> None:
+def test_candidate_ranking_and_human_flagging_logic(client: TestClient) -> None:
     """
     Tests for HITL (Human-in-the-Loop) Transparency (SAD Section 3/4).
     Verifies that candidates include ranking rationale and specific metrics 
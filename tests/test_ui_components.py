@@ -1,119 +1,247 @@
 """UI-focused tests that cover the Streamlit report download experience."""
 
-from typing import Any, Dict
+from contextlib import nullcontext
+from itertools import repeat
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, cast
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 
-from recruitment_assistant.ui import components
-from recruitment_assistant.ui.api_client import APIClient, APIResponse
+from recruitment_assistant.ui import api_client, components
+from recruitment_assistant.ui.api_client import APIClient, APIResponse, CircuitBreaker
 
 
-class DummyApiClient(APIClient):
+class DummyApiClient:
+    """Canned-report stand-in for APIClient; builds no HTTP session."""
+
     def __init__(self, response: APIResponse) -> None:
-        super().__init__(base_url="http://example.com")
         self._response = response
 
     def get_campaign_report(self, campaign_id: str) -> APIResponse:
         return self._response
 
 
-class StreamlitSpy:
-    class _DummyCtx:
-        def __enter__(self) -> "StreamlitSpy._DummyCtx":
-            return self
+# Stateless and reusable, so every container()/expander() block shares it.
+_NULL_CTX = nullcontext()
 
-        def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
-            return False
 
-    class ColumnSpy:
-        def __init__(self) -> None:
-            self.metric_calls: list = []
-            self.write_calls: list = []
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
 
-        def metric(self, *args: Any, **kwargs: Any) -> None:
-            self.metric_calls.append((args, kwargs))
 
-        def write(self, *args: Any, **kwargs: Any) -> None:
-            self.write_calls.append((args, kwargs))
+class StreamlitSpy:
+    __slots__ = ("download_button_count", "last_download_kwargs", "warning_calls", "_shared_column")
 
     def __init__(self) -> None:
-        self.download_button_calls: list = []
-        self.warning_calls: list = []
+        self.download_button_count = 0
+        self.last_download_kwargs: Optional[Dict[str, Any]] = None
+        self.warning_calls: List[str] = []
+        # spec limits columns to what render_final_report uses; calls are recorded by the mock.
+        self._shared_column = MagicMock(spec=["metric", "write"])
 
-    def container(self) -> "StreamlitSpy._DummyCtx":
-        return self._DummyCtx()
+    def container(self) -> "nullcontext[None]":
+        return _NULL_CTX
 
-    def columns(self, count: int) -> tuple["StreamlitSpy.ColumnSpy", ...]:
-        return tuple(self.ColumnSpy() for _ in range(count))
+    def columns(self, count: int) -> tuple[MagicMock, ...]:
+        # Tests never inspect individual columns, so every slot shares one mock.
+        return tuple(repeat(self._shared_column, count))
 
-    def expander(self, label: str, expanded: bool = False) -> "StreamlitSpy._DummyCtx":
-        return self._DummyCtx()
+    def expander(self, label: str, expanded: bool = False) -> "nullcontext[None]":
+        return _NULL_CTX
 
-    @staticmethod
-    def subheader(*args: Any, **kwargs: Any) -> None:
-        return None
+    # One shared no-op for every output call the tests don't inspect.
+    subheader = markdown = info = success = json = write = staticmethod(_noop)
 
-    @staticmethod
-    def markdown(*args: Any, **kwargs: Any) -> None:
-        return None
+    def download_button(self, *args: Any, **kwargs: Any) -> None:
+        self.download_button_count += 1
+        self.last_download_kwargs = kwargs
 
-    @staticmethod
-    def info(*args: Any, **kwargs: Any) -> None:
-        return None
+    def warning(self, message: str) -> None:
+        self.warning_calls.append(message)
 
-    @staticmethod
-    def success(*args: Any, **kwargs: Any) -> None:
-        return None
 
-    @staticmethod
-    def json(*args: Any, **kwargs: Any) -> None:
-        return None
+# Read-only all the way down, so every test can share it without defensive copies.
+REPORT_PAYLOAD: Mapping[str, Any] = MappingProxyType(
+    {
+        "campaign_id": "CAMP_001",
+        "session_summary": MappingProxyType(
+            {
+                "total_candidates_sourced": 2,
+                "high_quality_matches": 1,
+                "manual_review_items": 0,
+                "ethical_audit": MappingProxyType({"status": "ready"}),
+            }
+        ),
+        "performance_metrics": MappingProxyType(
+            {
+                "total_execution_time": "5s",
+                "avg_latency_per_agent": "0.2s",
+                "estimated_token_cost": 123,
+            }
+        ),
+        "recommendation": "Proceed with outreach",
+    }
+)
 
-    @staticmethod
-    def write(*args: Any, **kwargs: Any) -> None:
-        return None
 
-    def download_button(self, *args: Any, **kwargs: Any) -> None:
-        self.download_button_calls.append((args, kwargs))
+# REPORT_PAYLOAD is frozen, so one success response serves every test.
+_SUCCESS_RESPONSE = APIResponse(success=True, data=REPORT_PAYLOAD)
 
-    def warning(self, message: str) -> None:
-        self.warning_calls.append(message)
 
+@pytest.fixture(scope="module")
+def dummy_client() -> DummyApiClient:
+    return DummyApiClient(_SUCCESS_RESPONSE)
 
-REPORT_PAYLOAD: Dict[str, Any] = {
-    "campaign_id": "CAMP_001",
-    "session_summary": {
-        "total_candidates_sourced": 2,
-        "high_quality_matches": 1,
-        "manual_review_items": 0,
-        "ethical_audit": {"status": "ready"},
-    },
-    "performance_metrics": {
-        "total_execution_time": "5s",
-        "avg_latency_per_agent": "0.2s",
-        "estimated_token_cost": 123,
-    },
-    "recommendation": "Proceed with outreach",
-}
-
-
-def _render_final_report(monkeypatch: pytest.MonkeyPatch, pdf_bytes: bytes) -> StreamlitSpy:
-    """Drive render_final_report with a stubbed API client and Streamlit spy."""
-    stub = StreamlitSpy()
-    monkeypatch.setattr(components, "st", stub)
-    monkeypatch.setattr(components, "generate_pdf_report", lambda *_: pdf_bytes)
-    api_response = APIResponse(success=True, data=REPORT_PAYLOAD)
-    client = DummyApiClient(api_response)
-    components.render_final_report(client, [])
-    return stub
 
+def _render_final_report(client: DummyApiClient, pdf_bytes: bytes) -> StreamlitSpy:
+    """Drive render_final_report with a stubbed API client, Streamlit spy and PDF generator."""
+
+    pdf_calls: list = []
 
-def test_render_final_report_hides_download_button_when_pdf_is_empty(monkeypatch: pytest.MonkeyPatch) -> None:
-    stub = _render_final_report(monkeypatch, b"")
-    assert not stub.download_button_calls
+    def _fake_pdf(report: Dict[str, Any], candidates: Any) -> bytes:
+        pdf_calls.append(report["campaign_id"])
+        return pdf_bytes
+
+    stub = StreamlitSpy()
+    components.render_final_report(
+        cast(APIClient, client),
+        [],
+        st_module=stub,
+        pdf_generator=_fake_pdf,
+    )
+    assert pdf_calls == ["CAMP_001"]
+    return stub
 
 
-def test_render_final_report_warns_when_pdf_is_empty(monkeypatch: pytest.MonkeyPatch) -> None:
-    stub = _render_final_report(monkeypatch, b"")
-    assert stub.warning_calls
-    assert "Couldn't generate the PDF report" in stub.warning_calls[0]
\ No newline at end of file
+@pytest.mark.parametrize(
+    "pdf_bytes, button_hidden, warning_text",
+    [
+        (b"", True, "Couldn't generate the PDF report"),
+        (b"%PDF-1.7", False, None),
+    ],
+    ids=["empty-pdf", "populated-pdf"],
+)
+def test_render_final_report(
+    dummy_client: DummyApiClient,
+    pdf_bytes: bytes,
+    button_hidden: bool,
+    warning_text: Optional[str],
+) -> None:
+    stub = _render_final_report(dummy_client, pdf_bytes)
+    assert (stub.download_button_count == 0) is button_hidden
+    if warning_text is None:
+        assert not stub.warning_calls
+    else:
+        assert warning_text in stub.warning_calls[0]
+
+
+def test_fetch_dashboard_bundle_collects_each_panel() -> None:
+    client = APIClient("http://example.com")
+    client.get_campaign_report = lambda campaign_id: _SUCCESS_RESPONSE  # type: ignore[method-assign]
+    client.get_campaign_status = lambda campaign_id: APIResponse(success=True, data={"status": "ranked"})  # type: ignore[method-assign]
+    client.get_campaign_candidates = lambda campaign_id, limit=20, offset=0, fields=None: APIResponse(success=True, data=[])  # type: ignore[method-assign]
+    bundle = client.fetch_dashboard_bundle("CAMP_001")
+    assert bundle.status.data == {"status": "ranked"}
+    assert bundle.candidates.data == []
+    assert bundle.report.data == REPORT_PAYLOAD
+
+
+def _status_sequence(calls: list, failures: int) -> Any:
+    """Fake Session.request answering 503 for the first `failures` calls, then 200."""
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> Any:
+        calls.append(method)
+        response = requests.Response()
+        response.status_code = 503 if len(calls) <= failures else 200
+        response._content = b'{"status": "queued"}'
+        return response
+
+    return fake_request
+
+
+def test_api_client_retries_transient_status_on_get(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = APIClient("http://example.com")
+    monkeypatch.setattr(APIClient, "_backoff", staticmethod(lambda attempt: None))
+    calls: list = []
+    monkeypatch.setattr(client._session, "request", _status_sequence(calls, failures=2))
+    result = client.get_campaign_status("CAMP_001")
+    assert result.success and result.data == {"status": "queued"}
+    assert calls == ["GET"] * 3
+
+
+def test_api_client_does_not_replay_post_after_server_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = APIClient("http://example.com")
+    monkeypatch.setattr(APIClient, "_backoff", staticmethod(lambda attempt: None))
+    calls: list = []
+    monkeypatch.setattr(client._session, "request", _status_sequence(calls, failures=2))
+    result = client.send_outreach({"campaign_id": "CAMP_001", "candidate_id": "c", "message": "hi"})
+    assert not result.success
+    assert calls == ["POST"]
+
+
+def test_api_client_retries_post_only_on_connect_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = APIClient("http://example.com")
+    monkeypatch.setattr(APIClient, "_backoff", staticmethod(lambda attempt: None))
+    errors = [requests.ConnectTimeout("connect"), requests.ReadTimeout("read")]
+    calls: list = []
+
+    def fake_request(method: str, url: str, **kwargs: Any) -> Any:
+        calls.append(method)
+        raise errors[len(calls) - 1]
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    result = client.send_outreach({"campaign_id": "CAMP_001", "candidate_id": "c", "message": "hi"})
+    assert result.error == "Unable to reach the backend API at the moment. Please try again later."
+    assert calls == ["POST", "POST"]
+
+
+def test_circuit_breaker_short_circuits_after_repeated_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = APIClient("http://example.com", max_retries=0, breaker=CircuitBreaker(failure_threshold=2))
+    calls: list = []
+
+    def failing_request(method: str, url: str, **kwargs: Any) -> Any:
+        calls.append(url)
+        raise requests.ConnectionError("down")
+
+    monkeypatch.setattr(client._session, "request", failing_request)
+    for _ in range(3):
+        result = client.get_campaign_status("CAMP_001")
+    assert len(calls) == 2
+    assert result.error == "Backend temporarily unavailable"
+
+
+def test_circuit_breaker_admits_a_single_half_open_probe() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure()
+    assert [breaker.allow_request() for _ in range(3)] == [True, False, False]
+    breaker.record_success()
+    assert breaker.allow_request() and breaker.allow_request()
+
+
+def test_circuit_breaker_releases_probe_on_client_side_error() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure()
+    client = APIClient("http://example.com", breaker=breaker)
+    with pytest.raises(TypeError):
+        client.send_outreach({"campaign_id": "CAMP_001", "message": object()})
+    assert breaker.allow_request()
+
+
+def test_api_client_throttles_tracebacks_for_repeating_4xx(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = APIClient("http://example.com")
+
+    def not_found(method: str, url: str, **kwargs: Any) -> Any:
+        response = requests.Response()
+        response.status_code = 404
+        response._content = b"Campaign not found"
+        return response
+
+    logger = MagicMock()
+    monkeypatch.setattr(client._session, "request", not_found)
+    monkeypatch.setattr(api_client, "logger", logger)
+    for _ in range(5):
+        client.get_campaign_status("CAMP_404")
+    assert logger.error.call_count == 1
+    assert logger.warning.call_count == 4